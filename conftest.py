@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the reader tests.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+from lue import ui
+
+
+@pytest.fixture
+def make_book(monkeypatch):
+    """Return a factory that lays out a small book like the real reader does.
+
+    The terminal size is pinned so the layout does not depend on where the
+    tests run; call the factory again (or update_document_layout) to relayout.
+    """
+    def make(chapters, width=80, height=24, **attrs):
+        monkeypatch.setattr(ui, "get_terminal_size", lambda: (width, height))
+        reader = SimpleNamespace(
+            chapters=chapters,
+            console=Console(width=200),
+            chapter_idx=0, paragraph_idx=0, sentence_idx=0,
+            ui_chapter_idx=0, ui_paragraph_idx=0, ui_sentence_idx=0,
+            scroll_offset=0,
+            auto_scroll_enabled=False,
+            **attrs,
+        )
+        ui.update_document_layout(reader)
+        return reader
+    return make
@@ -9,36 +9,40 @@ from html.parser import HTMLParser
 from html import unescape
 
 
+# A list of common English abbreviations that can be followed by a period.
+_ABBREVIATIONS = [
+    "Mr", "Mrs", "Ms", "Dr", "Prof", "Rev", "Hon", "Jr", "Sr",
+    "Cpl", "Sgt", "Gen", "Col", "Capt", "Lt", "Pvt",
+    "vs", "viz", "etc", "eg", "ie",
+    "Co", "Inc", "Ltd", "Corp",
+    "St", "Ave", "Blvd"
+]
+
+# Sentence splitting patterns, compiled once at import time.
+_ABBREV_RE = re.compile(r"\b(" + "|".join(_ABBREVIATIONS) + r")\.", re.IGNORECASE)
+# A single capital letter, a period, a space, and another capital letter (e.g., "J. F. Kennedy").
+_INITIAL_RE = re.compile(r"\b([A-Z])\.(?=\s[A-Z])")
+# The lookbehind `(?<=[.!?])` keeps the delimiter with the sentence.
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Use a unique placeholder that is highly unlikely to be in the original text.
+_PERIOD_PLACEHOLDER = "<LUE_PERIOD>"
+
+
 def split_into_sentences(paragraph: str) -> list[str]:
     """
     Splits a paragraph into sentences, intelligently handling common abbreviations and initials.
     """
-    # A list of common English abbreviations that can be followed by a period.
-    abbreviations = [
-        "Mr", "Mrs", "Ms", "Dr", "Prof", "Rev", "Hon", "Jr", "Sr",
-        "Cpl", "Sgt", "Gen", "Col", "Capt", "Lt", "Pvt",
-        "vs", "viz", "etc", "eg", "ie",
-        "Co", "Inc", "Ltd", "Corp",
-        "St", "Ave", "Blvd"
-    ]
-    
-    # Create a regex pattern for these abbreviations.
-    abbrev_pattern = r"\b(" + "|".join(abbreviations) + r")\."
-    
-    # Use a unique placeholder that is highly unlikely to be in the original text.
-    placeholder = "<LUE_PERIOD>"
+    placeholder = _PERIOD_PLACEHOLDER
     
     # 1. Protect periods in abbreviations by replacing them with the placeholder.
-    paragraph = re.sub(abbrev_pattern, r"\1" + placeholder, paragraph, flags=re.IGNORECASE)
+    paragraph = _ABBREV_RE.sub(r"\1" + placeholder, paragraph)
     
     # 2. Protect periods in initials (e.g., "J. F. Kennedy").
-    # This looks for a single capital letter, a period, a space, and another capital letter.
-    initial_pattern = r"\b([A-Z])\.(?=\s[A-Z])"
-    paragraph = re.sub(initial_pattern, r"\1" + placeholder, paragraph)
+    paragraph = _INITIAL_RE.sub(r"\1" + placeholder, paragraph)
     
     # 3. Split the text into sentences using the remaining punctuation.
-    # The lookbehind `(?<=[.!?])` keeps the delimiter with the sentence.
-    sentences = re.split(r'(?<=[.!?])\s+', paragraph)
+    sentences = _SENT_RE.split(paragraph)
     
     # 4. Restore the periods and clean up the results.
     restored_sentences = []
@@ -52,6 +56,22 @@ def split_into_sentences(paragraph: str) -> list[str]:
     return restored_sentences if restored_sentences else [paragraph]
 
 
+# Sentence splits keyed by paragraph identity. Each entry holds on to its paragraph
+# so the id cannot be reused while it is cached. Cleared whenever a book is loaded.
+_split_by_id = {}
+
+
+def split_into_sentences_cached(paragraph: str) -> list[str]:
+    """
+    Same as split_into_sentences, but remembers the result per paragraph object.
+    The returned list is shared between callers and must not be modified.
+    """
+    entry = _split_by_id.get(id(paragraph))
+    if entry is None or entry[0] is not paragraph:
+        entry = _split_by_id[id(paragraph)] = (paragraph, split_into_sentences(paragraph))
+    return entry[1]
+
+
 def clean_text_for_tts(text):
     """
     Global text cleaning function to make content more TTS-friendly.
@@ -389,6 +409,8 @@ class HTMLtoLines(HTMLParser):
 
 def extract_content(file_path, console):
     """Extract content from the file based on its extension."""
+    # Splits from a previous book are never needed again
+    _split_by_id.clear()
     file_extension = os.path.splitext(file_path)[1].lower()
     if file_extension == '.epub':
         return _extract_content_epub(file_path, console)
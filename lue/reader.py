@@ -41,6 +41,13 @@ class Lue:
         self.active_playback_tasks = []
         self.audio_restart_lock = asyncio.Lock()
         self.pending_restart_task = None
+        self.pending_click_target = None
+        self._click_debounce_task = None
+        self._cmd_handlers = {
+            '_update_highlight': self._handle_update_highlight,
+            'click_jump': self._handle_click_jump,
+            'quit': self._handle_quit,
+        }
         
     def _initialize_tts(self, tts_model):
         """Initialize TTS-related state."""
@@ -58,6 +65,8 @@ class Lue:
         self.line_to_position = {}
         self.position_to_line = {}
         self.paragraph_line_ranges = {}
+        # Bumped by ui.update_document_layout on every relayout
+        self.layout_version = 0
         
         self.total_sentences = sum(
             len(content_parser.split_into_sentences(paragraph)) 
@@ -603,7 +612,7 @@ class Lue:
         signal.signal(signal.SIGTERM, signal.SIG_DFL)
         
         # Cancel all tasks including pending restart task
-        tasks_to_cancel = [self.smooth_scroll_task, self.background_task, self.pending_restart_task]
+        tasks_to_cancel = [self.smooth_scroll_task, self.background_task, self.pending_restart_task, self._click_debounce_task]
         for task in tasks_to_cancel:
             if task and not task.done():
                 task.cancel()
@@ -678,18 +687,37 @@ class Lue:
             self.command = None
             if not cmd: continue
             
-            if isinstance(cmd, tuple):
-                command_name, data = cmd
-                if command_name == '_update_highlight':
-                    if not self.is_paused: self.chapter_idx, self.paragraph_idx, self.sentence_idx = data
-                elif command_name == 'click_jump':
-                    if clicked_position := self._find_sentence_at_click(*data):
-                        self.first_sentence_jump = False
-                        self.chapter_idx, self.paragraph_idx, self.sentence_idx = clicked_position
-                        self.ui_chapter_idx, self.ui_paragraph_idx, self.ui_sentence_idx = clicked_position
-                        self.auto_scroll_enabled = False
-                        self._save_extended_progress(sync_audio_position=True)
-                        self.pending_restart_task = asyncio.create_task(self._restart_audio_after_navigation())
-                continue
+            is_tuple = isinstance(cmd, tuple)
+            handler = self._cmd_handlers.get(cmd[0] if is_tuple else cmd)
+            if handler: handler(cmd[1] if is_tuple else None)
             
-        await self._shutdown()
\ No newline at end of file
+        await self._shutdown()
+
+    def _handle_update_highlight(self, data):
+        if not self.is_paused: self.chapter_idx, self.paragraph_idx, self.sentence_idx = data
+
+    def _handle_click_jump(self, data):
+        # Drag events arrive at mouse-motion rate; only the last target within
+        # the debounce window is applied, so audio restarts once per drag.
+        if clicked_position := self._find_sentence_at_click(*data):
+            self.pending_click_target = clicked_position
+            if self._click_debounce_task and not self._click_debounce_task.done():
+                self._click_debounce_task.cancel()
+            self._click_debounce_task = asyncio.create_task(self._debounced_click_jump(0.15))
+
+    async def _debounced_click_jump(self, delay):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            return
+        clicked_position, self.pending_click_target = self.pending_click_target, None
+        if not clicked_position: return
+        self.first_sentence_jump = False
+        self.chapter_idx, self.paragraph_idx, self.sentence_idx = clicked_position
+        self.ui_chapter_idx, self.ui_paragraph_idx, self.ui_sentence_idx = clicked_position
+        self.auto_scroll_enabled = False
+        self._save_extended_progress(sync_audio_position=True)
+        self.pending_restart_task = asyncio.create_task(self._restart_audio_after_navigation())
+
+    def _handle_quit(self, _data):
+        self.running = False
\ No newline at end of file
@@ -3,90 +3,409 @@ Adapter layer to bridge existing Lue reader functionality with Textual interface
 This preserves all existing methods while adding Textual-compatible interfaces.
 """
 
+import asyncio
+import time
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
 from typing import List
+from rich.style import Style
 from rich.text import Text
-from . import content_parser
+from . import ui, content_parser
+
+
+# Styles parsed once instead of on every append
+_HILITE = Style.parse("bold yellow on blue")
+_PLAIN = Style.parse("white")
+_DIM = Style.parse("dim")
+
+# Adapter methods installed onto the Lue instance by create_textual_adapter
+_EXPORTED = (
+    'get_current_display_content',
+    'get_reading_progress',
+    'get_chapter_titles',
+    'get_current_sentence',
+    'jump_to_chapter',
+    'get_ai_response',
+    'move_to_prev_paragraph',
+    'move_to_next_paragraph',
+    'move_to_prev_sentence',
+    'move_to_next_sentence',
+    'scroll_page_up',
+    'scroll_page_down',
+    'scroll_up',
+    'scroll_down',
+    'move_to_beginning',
+    'move_to_end',
+    'move_to_top_visible',
+    'toggle_pause',
+    'toggle_auto_scroll',
+)
+
+
+def _clamp(value, lo, hi):
+    """Clamp value into [lo, hi], preferring lo when the range is empty."""
+    return lo if value < lo else hi if value > hi else value
 
 
 class TextualReaderAdapter:
     """Adapter to make existing Lue reader compatible with Textual interface."""
     
+    __slots__ = (
+        'lue',
+        '_sentence_cache_chapters',
+        '_chapter_para_offsets', '_para_sentence_prefix', '_total_sentences', '_total_paragraphs', '_prefix_chapters',
+        '_highlight_cache',
+        '_last_render_key', '_last_render_source', '_last_render_value',
+        '_render_broken_state', '_render_broken_text',
+        '_basic_cache_key', '_basic_cache_chapters', '_basic_cache_text',
+        '_cached_term_size', '_term_size_tick', '_term_size_layout',
+        '_para_starts', '_para_keys', '_para_source',
+        '_pos_to_line_arr', '_pos_to_line_source', '_pos_to_line_chapters',
+        '_chapter_titles_cache', '_chapter_titles_chapters',
+        '_save_dirty', '_save_last_ts', '_save_flush_handle', '_write_progress', '_deferring_save',
+        '_has_nav_immediate',
+        '_has_beginning_immediate', '_has_end_immediate', '_has_scroll_to_immediate',
+        '_has_document_lines', '_has_pos_map', '_has_para_ranges',
+        '_has_ui_idx', '_has_smooth_scroll', '_has_save',
+        '_has_tts_model', '_has_async_restart', '_has_playback',
+    )
+    
+    # Seconds a sampled terminal size stays valid for rendering and navigation maths
+    _TERM_SIZE_TTL = 0.25
+    # Minimum seconds between progress writes while scrolling
+    _SAVE_INTERVAL = 0.5
+    # Highlighted paragraphs kept by _build_highlighted_paragraph
+    _HIGHLIGHT_CACHE_SIZE = 8
+    
     def __init__(self, lue_instance):
         self.lue = lue_instance
+        # Chapters list the cached sentence-derived state was built from
+        self._sentence_cache_chapters = None
+        # Flat prefix sums backing get_reading_progress: first book-wide paragraph
+        # of each chapter, and sentences before each book-wide paragraph
+        self._chapter_para_offsets = None
+        self._para_sentence_prefix = None
+        self._total_sentences = 0
+        self._total_paragraphs = 0
+        self._prefix_chapters = None
+        # Recently built highlighted paragraphs, see _build_highlighted_paragraph
+        self._highlight_cache = OrderedDict()
+        # Last frame returned by get_current_display_content and the state it was built from
+        self._last_render_key = None
+        self._last_render_source = None
+        self._last_render_value = None
+        # Error frame reused while the state that produced it is unchanged
+        self._render_broken_state = None
+        self._render_broken_text = None
+        # Last fallback display built by _get_basic_content_display
+        self._basic_cache_key = None
+        self._basic_cache_chapters = None
+        self._basic_cache_text = None
+        # Terminal size sampled at most every _TERM_SIZE_TTL seconds
+        self._cached_term_size = None
+        self._term_size_tick = 0.0
+        self._term_size_layout = None
+        # Sorted paragraph start lines with their (chapter, paragraph) keys
+        self._para_starts = None
+        self._para_keys = None
+        self._para_source = None
+        # Flat int array mirroring lue.position_to_line, indexed by book-wide sentence
+        self._pos_to_line_arr = None
+        self._pos_to_line_source = None
+        self._pos_to_line_chapters = None
+        # Chapter titles for the current book
+        self._chapter_titles_cache = None
+        self._chapter_titles_chapters = None
+        # Progress writes coalesced by _mark_save_dirty
+        self._save_dirty = False
+        self._save_last_ts = 0.0
+        self._save_flush_handle = None
+        # Lue's own save method, kept for when create_textual_adapter replaces it
+        self._write_progress = getattr(lue_instance, '_save_extended_progress', None)
+        # Set while a Lue handler runs whose progress write should be coalesced
+        self._deferring_save = False
+        # Which optional reader hooks exist, probed once instead of per call
+        self._refresh_capabilities()
+        
+    def _refresh_capabilities(self) -> None:
+        """Snapshot which optional attributes the Lue instance provides."""
+        lue = self.lue
+        self._has_nav_immediate = hasattr(lue, '_handle_navigation_immediate')
+        self._has_beginning_immediate = hasattr(lue, '_handle_move_to_beginning_immediate')
+        self._has_end_immediate = hasattr(lue, '_handle_move_to_end_immediate')
+        self._has_scroll_to_immediate = hasattr(lue, '_scroll_to_position_immediate')
+        self._has_document_lines = hasattr(lue, 'document_lines')
+        self._has_pos_map = hasattr(lue, 'position_to_line')
+        self._has_para_ranges = hasattr(lue, 'paragraph_line_ranges')
+        self._has_ui_idx = hasattr(lue, 'ui_chapter_idx')
+        self._has_smooth_scroll = hasattr(lue, 'smooth_scroll_task')
+        self._has_save = hasattr(lue, '_save_extended_progress')
+        self._has_tts_model = hasattr(lue, 'tts_model')
+        self._has_async_restart = (hasattr(lue, '_restart_audio_after_navigation') and
+                                   hasattr(lue, 'loop') and hasattr(lue, 'pending_restart_task'))
+        self._has_playback = hasattr(lue, 'playback_processes')
+        
+    def _get_terminal_size(self):
+        """Get the terminal size, re-querying it only when stale or after a relayout."""
+        now = time.monotonic()
+        # A resize relayouts the document, so a new document_lines list means the size moved
+        layout = self.lue.document_lines if self._has_document_lines else None
+        if (self._cached_term_size is None or layout is not self._term_size_layout or
+                now - self._term_size_tick > self._TERM_SIZE_TTL):
+            self._cached_term_size = ui.get_terminal_size()
+            self._term_size_tick = now
+            self._term_size_layout = layout
+        return self._cached_term_size
+        
+    def _get_available_height(self) -> int:
+        """Get the content height from the cached terminal size."""
+        return max(1, self._get_terminal_size()[1] - 4)
+        
+    def _get_sentences(self, chapter_idx: int, para_idx: int) -> List[str]:
+        """Get the sentences of a paragraph, splitting it only once per book."""
+        self._sync_chapters()
+        return content_parser.split_into_sentences_cached(self.lue.chapters[chapter_idx][para_idx])
+        
+    def _paragraph_at_or_before_line(self, line_idx: int):
+        """Find the (chapter, paragraph) whose first line is the last one at or before line_idx."""
+        ranges = self.lue.paragraph_line_ranges
+        if self._para_source is not ranges:
+            # update_document_layout replaces the dict, so identity tracks relayouts
+            keys = sorted(ranges, key=lambda k: ranges[k][0])
+            self._para_starts = array('i', (ranges[k][0] for k in keys))
+            self._para_keys = keys
+            self._para_source = ranges
+            
+        idx = bisect_right(self._para_starts, line_idx) - 1
+        return self._para_keys[idx] if idx >= 0 else None
+        
+    def _position_at_or_before_line(self, line_idx: int):
+        """Find the position of the nearest indexed line at or before line_idx."""
+        # Every wrapped line maps to its paragraph's first sentence and separator
+        # lines belong to the paragraph above, so the owning paragraph is enough
+        para_key = self._paragraph_at_or_before_line(line_idx)
+        return (*para_key, 0) if para_key is not None else None
+        
+    def _sentence_index(self, chapter_idx: int, para_idx: int, sentence_idx: int) -> int:
+        """Get the book-wide index of a sentence, or -1 if it does not exist."""
+        self._ensure_progress_index()
+        offsets = self._chapter_para_offsets
+        if not 0 <= chapter_idx < len(offsets) - 1:
+            return -1
+        if not 0 <= para_idx < offsets[chapter_idx + 1] - offsets[chapter_idx]:
+            return -1
+        prefix = self._para_sentence_prefix
+        para = offsets[chapter_idx] + para_idx
+        if not 0 <= sentence_idx < prefix[para + 1] - prefix[para]:
+            return -1
+        return prefix[para] + sentence_idx
+        
+    def _line_for_position(self, chapter_idx: int, para_idx: int, sentence_idx: int) -> int:
+        """Get the document line a sentence starts on, or -1 if it is not laid out."""
+        position_to_line = self.lue.position_to_line
+        if (self._pos_to_line_source is not position_to_line or
+                self._pos_to_line_chapters is not self.lue.chapters):
+            self._ensure_progress_index()
+            lines = array('i', [-1]) * self._total_sentences
+            for (c, p, s), line in position_to_line.items():
+                idx = self._sentence_index(c, p, s)
+                if idx >= 0:
+                    lines[idx] = line
+            self._pos_to_line_arr = lines
+            self._pos_to_line_source = position_to_line
+            self._pos_to_line_chapters = self.lue.chapters
+            
+        idx = self._sentence_index(chapter_idx, para_idx, sentence_idx)
+        return self._pos_to_line_arr[idx] if idx >= 0 else -1
+        
+    def _mark_save_dirty(self) -> None:
+        """Save progress now if the last write is old enough, otherwise schedule a trailing save."""
+        if not self._has_save:
+            return
+        if time.monotonic() - self._save_last_ts > self._SAVE_INTERVAL:
+            self._flush_save()
+            return
+            
+        self._save_dirty = True
+        if self._save_flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop to defer to, write synchronously
+                self._flush_save()
+                return
+            self._save_flush_handle = loop.call_later(self._SAVE_INTERVAL, self._flush_save)
+            
+    def _flush_save(self) -> None:
+        """Write progress and clear any pending trailing save."""
+        if self._save_flush_handle is not None:
+            self._save_flush_handle.cancel()
+            self._save_flush_handle = None
+        self._save_dirty = False
+        self._save_last_ts = time.monotonic()
+        self._write_progress()
+        
+    def _save_extended_progress(self, sync_audio_position: bool = False) -> None:
+        """Stand-in for lue._save_extended_progress, installed by create_textual_adapter.
+        
+        Writes made inside _run_deferring_save are coalesced by _mark_save_dirty;
+        any other write happens at once and replaces a pending trailing save.
+        """
+        if sync_audio_position and self._has_ui_idx:
+            lue = self.lue
+            lue.chapter_idx, lue.paragraph_idx, lue.sentence_idx = (
+                lue.ui_chapter_idx, lue.ui_paragraph_idx, lue.ui_sentence_idx)
+        if self._deferring_save:
+            self._mark_save_dirty()
+        else:
+            self._flush_save()
+            
+    def _run_deferring_save(self, handler, *args) -> None:
+        """Run a Lue navigation handler with its progress write debounced."""
+        self._deferring_save = True
+        try:
+            handler(*args)
+        finally:
+            self._deferring_save = False
+        
+    @staticmethod
+    def _highlight_parts(sentences: List[str], sent_idx: int) -> List[tuple]:
+        """Get (text, style) pairs for a paragraph with one sentence highlighted."""
+        last = len(sentences) - 1
+        parts = []
+        for i, sentence in enumerate(sentences):
+            parts.append((sentence, _HILITE if i == sent_idx else _PLAIN))
+            if i < last:
+                parts.append((" ", _PLAIN))
+        return parts
+        
+    def _build_highlighted_paragraph(self, chapter_idx: int, para_idx: int, sent_idx: int,
+                                     available_width: int = None):
+        """Get a paragraph with one sentence highlighted, wrapped into lines if a width is given."""
+        # Entries from a previous book must not satisfy the lookup
+        self._sync_chapters()
+        key = (chapter_idx, para_idx, sent_idx, available_width)
+        cache = self._highlight_cache
+        highlighted = cache.get(key)
+        if highlighted is not None:
+            cache.move_to_end(key)
+            return highlighted
+            
+        sentences = self._get_sentences(chapter_idx, para_idx)
+        highlighted = Text.assemble(*self._highlight_parts(sentences, sent_idx), justify="left", no_wrap=False)
+        if available_width is not None:
+            highlighted = highlighted.wrap(self.lue.console, available_width)
+            
+        cache[key] = highlighted
+        if len(cache) > self._HIGHLIGHT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return highlighted
+        
+    def _sync_chapters(self) -> None:
+        """Forget cached highlighted paragraphs when lue.chapters has been replaced."""
+        if self._sentence_cache_chapters is not self.lue.chapters:
+            self._sentence_cache_chapters = self.lue.chapters
+            self._highlight_cache.clear()
+        
+    def _ensure_progress_index(self) -> None:
+        """Build flat cumulative paragraph and sentence counts plus the book totals."""
+        if self._prefix_chapters is self.lue.chapters:
+            return
+            
+        chapter_offsets = array('i', [0])
+        sentence_prefix = array('i', [0])
+        total = 0
+        for chapter_idx, chapter in enumerate(self.lue.chapters):
+            for para_idx in range(len(chapter)):
+                total += len(self._get_sentences(chapter_idx, para_idx))
+                sentence_prefix.append(total)
+            chapter_offsets.append(chapter_offsets[-1] + len(chapter))
+            
+        self._chapter_para_offsets = chapter_offsets
+        self._para_sentence_prefix = sentence_prefix
+        self._total_sentences = total
+        self._total_paragraphs = chapter_offsets[-1]
+        self._prefix_chapters = self.lue.chapters
         
     def get_current_display_content(self, height: int = 20) -> Text:
         """Get formatted content for current view with proper highlighting."""
+        # A frame that failed keeps failing until the position or layout moves,
+        # so hand back the same error instead of re-raising on every refresh
+        if self._render_broken_text is not None:
+            if self._render_state(height) == self._render_broken_state:
+                return self._render_broken_text
+            self._render_broken_text = None
+            
         try:
-            # Import here to avoid circular imports
-            from . import ui, content_parser
-            from .ui_theme import COLORS
-            
-            # Use existing UI layout if available
-            if hasattr(self.lue, 'document_lines') and self.lue.document_lines:
-                # Get terminal dimensions
-                width, term_height = ui.get_terminal_size()
-                available_width = max(20, width - 10)
-                display_height = min(height, term_height - 4)
-                
-                start_line = max(0, int(getattr(self.lue, 'scroll_offset', 0)))
-                end_line = min(len(self.lue.document_lines), start_line + display_height)
-                
-                visible_lines = []
-                current_paragraph_key = (self.lue.chapter_idx, self.lue.paragraph_idx)
-                
-                # Get highlighted paragraph content
-                highlighted_paragraph_lines = None
-                if (hasattr(self.lue, 'paragraph_line_ranges') and 
-                    current_paragraph_key in self.lue.paragraph_line_ranges):
-                    
-                    para_start, para_end = self.lue.paragraph_line_ranges[current_paragraph_key]
-                    paragraph = self.lue.chapters[self.lue.chapter_idx][self.lue.paragraph_idx]
-                    sentences = content_parser.split_into_sentences(paragraph)
-                    highlighted_text = Text(justify="left", no_wrap=False)
-                    
-                    # Build highlighted paragraph with current sentence emphasized
-                    for sent_idx, sentence in enumerate(sentences):
-                        if sent_idx == self.lue.sentence_idx:
-                            highlighted_text.append(sentence, style="bold yellow on blue")
-                        else:
-                            highlighted_text.append(sentence, style="white")
-                        if sent_idx < len(sentences) - 1:
-                            highlighted_text.append(" ", style="white")
-                    
-                    highlighted_paragraph_lines = highlighted_text.wrap(self.lue.console, available_width)
-                
-                # Build visible content
-                for i in range(start_line, end_line):
-                    if i < len(self.lue.document_lines):
-                        line = self.lue.document_lines[i]
-                        
-                        # Check if this line is part of current paragraph
-                        if (hasattr(self.lue, 'line_to_position') and 
-                            i in self.lue.line_to_position and
-                            self.lue.line_to_position[i][:2] == current_paragraph_key and
-                            highlighted_paragraph_lines is not None):
-                            
-                            para_start, para_end = self.lue.paragraph_line_ranges[current_paragraph_key]
-                            line_offset = i - para_start
-                            
-                            if 0 <= line_offset < len(highlighted_paragraph_lines):
-                                line = highlighted_paragraph_lines[line_offset]
-                        
-                        visible_lines.append(str(line))
-                
-                return Text("\n".join(visible_lines))
-            else:
-                # Fallback to basic paragraph display
-                return self._get_basic_content_display()
-                
+            return self._render_fast(height)
         except Exception as e:
-            return Text(f"Error loading content: {str(e)}")
+            self._render_broken_state = self._render_state(height)
+            self._render_broken_text = Text(f"Error loading content: {str(e)}")
+            return self._render_broken_text
+            
+    def _render_state(self, height: int) -> tuple:
+        """Get the reader state a rendered frame depends on, tolerating missing attributes."""
+        return (getattr(self.lue, 'chapter_idx', 0), getattr(self.lue, 'paragraph_idx', 0),
+                getattr(self.lue, 'sentence_idx', 0), getattr(self.lue, 'scroll_offset', 0), height,
+                id(getattr(self.lue, 'document_lines', None)))
+            
+    def _render_fast(self, height: int) -> Text:
+        """Build the current view; errors propagate to get_current_display_content."""
+        # Use existing UI layout if available
+        if self._has_document_lines and self.lue.document_lines:
+            # Get terminal dimensions
+            width, term_height = self._get_terminal_size()
+            available_width = max(20, width - 10)
+            display_height = min(height, term_height - 4)
+            
+            scroll = getattr(self.lue, 'scroll_offset', 0)
+            start_line = 0 if scroll < 0 else int(scroll)
+            end_line = min(len(self.lue.document_lines), start_line + display_height)
+            
+            # Reuse the last frame if nothing it depends on has changed
+            render_key = (self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx,
+                          start_line, display_height, available_width)
+            if render_key == self._last_render_key and self.lue.document_lines is self._last_render_source:
+                return self._last_render_value
+            
+            current_paragraph_key = (self.lue.chapter_idx, self.lue.paragraph_idx)
+            
+            # Read the current paragraph's line range once; (-1, -1) when it is not laid out
+            para_start, para_end = (self.lue.paragraph_line_ranges.get(current_paragraph_key, (-1, -1))
+                                    if self._has_para_ranges else (-1, -1))
+            
+            # Get highlighted paragraph content, skipping it when the paragraph is off screen
+            highlighted_paragraph_lines = None
+            if para_start >= 0 and para_start < end_line and para_end >= start_line:
+                highlighted_paragraph_lines = self._build_highlighted_paragraph(
+                    self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx, available_width)
+            
+            # Build visible content from one slice of the document, keeping line styles.
+            # update_document_layout only stores Text lines, so no per-line wrapping is needed.
+            visible_lines = self.lue.document_lines[start_line:end_line]
+            
+            # Swap in the highlighted lines where the current paragraph is on screen
+            if highlighted_paragraph_lines is not None:
+                lo = max(start_line, para_start)
+                hi = min(end_line, para_end + 1, para_start + len(highlighted_paragraph_lines))
+                if lo < hi:
+                    visible_lines[lo - start_line:hi - start_line] = highlighted_paragraph_lines[lo - para_start:hi - para_start]
+            
+            content = Text("\n").join(visible_lines)
+            self._last_render_key = render_key
+            self._last_render_source = self.lue.document_lines
+            self._last_render_value = content
+            return content
+        else:
+            # Fallback to basic paragraph display
+            return self._get_basic_content_display()
             
     def _line_contains_current_sentence(self, line_idx: int) -> bool:
         """Check if line contains the current sentence."""
         try:
             current_pos = (self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx)
-            if hasattr(self.lue, 'position_to_line') and current_pos in self.lue.position_to_line:
+            if self._has_pos_map and current_pos in self.lue.position_to_line:
                 current_line = self.lue.position_to_line[current_pos]
                 return abs(line_idx - current_line) < 2  # Highlight nearby lines
             return False
@@ -96,7 +415,6 @@ class TextualReaderAdapter:
     def _get_basic_content_display(self) -> Text:
         """Basic content display as fallback with sentence highlighting."""
         try:
-            from . import content_parser
             
             chapter_idx = getattr(self.lue, 'chapter_idx', 0)
             para_idx = getattr(self.lue, 'paragraph_idx', 0)
@@ -105,44 +423,34 @@ class TextualReaderAdapter:
             if (chapter_idx < len(self.lue.chapters) and 
                 para_idx < len(self.lue.chapters[chapter_idx])):
                 
+                # Reuse the previous display while the position and book are unchanged
+                key = (chapter_idx, para_idx, sent_idx)
+                if key == self._basic_cache_key and self.lue.chapters is self._basic_cache_chapters:
+                    return self._basic_cache_text
+                    
                 chapter = self.lue.chapters[chapter_idx]
                 content_lines = []
                 
                 # Add previous paragraph for context
                 if para_idx > 0:
                     prev_para = chapter[para_idx - 1]
-                    content_lines.append(Text(prev_para, style="dim"))
+                    content_lines.append(Text(prev_para, style=_DIM))
                     content_lines.append(Text(""))
                 
                 # Current paragraph with sentence highlighting
-                current_para = chapter[para_idx]
-                sentences = content_parser.split_into_sentences(current_para)
-                
-                highlighted_para = Text()
-                for i, sentence in enumerate(sentences):
-                    if i == sent_idx:
-                        highlighted_para.append(sentence, style="bold yellow on blue")
-                    else:
-                        highlighted_para.append(sentence, style="white")
-                    if i < len(sentences) - 1:
-                        highlighted_para.append(" ", style="white")
-                
-                content_lines.append(highlighted_para)
+                content_lines.append(self._build_highlighted_paragraph(chapter_idx, para_idx, sent_idx))
                 
                 # Add next paragraph for context
                 if para_idx + 1 < len(chapter):
                     content_lines.append(Text(""))
                     next_para = chapter[para_idx + 1]
-                    content_lines.append(Text(next_para, style="dim"))
+                    content_lines.append(Text(next_para, style=_DIM))
                 
                 # Combine all content
-                result = Text()
-                for i, line in enumerate(content_lines):
-                    if i > 0:
-                        result.append("\n")
-                    result.append(line)
-                
-                return result
+                self._basic_cache_text = Text("\n").join(content_lines)
+                self._basic_cache_key = key
+                self._basic_cache_chapters = self.lue.chapters
+                return self._basic_cache_text
             else:
                 return Text("No content available")
                 
@@ -152,43 +460,41 @@ class TextualReaderAdapter:
     def get_reading_progress(self) -> float:
         """Get current reading progress as percentage."""
         try:
-            if hasattr(self.lue, 'total_sentences') and self.lue.total_sentences > 0:
-                # Calculate based on sentences
-                current_sentences = 0
-                for i in range(self.lue.chapter_idx):
-                    for paragraph in self.lue.chapters[i]:
-                        current_sentences += len(content_parser.split_into_sentences(paragraph))
-                
-                for i in range(self.lue.paragraph_idx):
-                    paragraph = self.lue.chapters[self.lue.chapter_idx][i]
-                    current_sentences += len(content_parser.split_into_sentences(paragraph))
-                
-                current_sentences += self.lue.sentence_idx
+            self._ensure_progress_index()
+            if self._total_sentences > 0:
+                # Calculate based on sentences: two array reads, two adds and a divide
+                para = self._chapter_para_offsets[self.lue.chapter_idx] + self.lue.paragraph_idx
+                current_sentences = self._para_sentence_prefix[para] + self.lue.sentence_idx
                 
-                return (current_sentences / self.lue.total_sentences) * 100
+                return (current_sentences / self._total_sentences) * 100
             else:
                 # Fallback to paragraph-based calculation
-                total_paragraphs = sum(len(chapter) for chapter in self.lue.chapters)
-                current_paragraph = sum(len(self.lue.chapters[i]) for i in range(self.lue.chapter_idx))
-                current_paragraph += self.lue.paragraph_idx
+                current_paragraph = self._chapter_para_offsets[self.lue.chapter_idx] + self.lue.paragraph_idx
                 
-                return (current_paragraph / total_paragraphs * 100) if total_paragraphs > 0 else 0
+                return (current_paragraph / self._total_paragraphs * 100) if self._total_paragraphs > 0 else 0
                 
         except Exception:
             return 0.0
     
     def get_chapter_titles(self) -> List[str]:
         """Get list of chapter titles using proper content parser."""
+        if self._chapter_titles_cache is not None and self.lue.chapters is self._chapter_titles_chapters:
+            return self._chapter_titles_cache
+            
         try:
-            from . import content_parser
             # Use the proper extract_chapter_titles function that returns (index, title) tuples
             file_path = getattr(self.lue, 'file_path', None)
             chapter_title_tuples = content_parser.extract_chapter_titles(self.lue.chapters, file_path)
             # Extract just the titles for the list
-            return [title for idx, title in chapter_title_tuples]
+            titles = [title for idx, title in chapter_title_tuples]
         except Exception:
             # Fallback: generate basic titles
-            return [f"Chapter {i+1}" for i in range(len(self.lue.chapters))]
+            titles = [f"Chapter {i+1}" for i in range(len(self.lue.chapters))]
+            
+        # Cache either result; the fallback would only fail the same way again
+        self._chapter_titles_cache = titles
+        self._chapter_titles_chapters = self.lue.chapters
+        return titles
     
     def get_current_sentence(self) -> str:
         """Get the current sentence text."""
@@ -200,8 +506,7 @@ class TextualReaderAdapter:
             if (chapter_idx < len(self.lue.chapters) and 
                 para_idx < len(self.lue.chapters[chapter_idx])):
                 
-                paragraph = self.lue.chapters[chapter_idx][para_idx]
-                sentences = content_parser.split_into_sentences(paragraph)
+                sentences = self._get_sentences(chapter_idx, para_idx)
                 
                 if sent_idx < len(sentences):
                     return sentences[sent_idx].strip()
@@ -212,27 +517,23 @@ class TextualReaderAdapter:
     
     def jump_to_chapter(self, chapter_idx: int) -> None:
         """Jump to specified chapter."""
-        try:
-            if 0 <= chapter_idx < len(self.lue.chapters):
-                self.lue.chapter_idx = chapter_idx
-                self.lue.paragraph_idx = 0
-                self.lue.sentence_idx = 0
-                
-                # Update UI state if available
-                if hasattr(self.lue, 'ui_chapter_idx'):
-                    self.lue.ui_chapter_idx = chapter_idx
-                    self.lue.ui_paragraph_idx = 0
-                    self.lue.ui_sentence_idx = 0
-                
-                # Update scroll position if available
-                if hasattr(self.lue, 'position_to_line'):
-                    new_pos = (chapter_idx, 0, 0)
-                    if new_pos in self.lue.position_to_line:
-                        self.lue.scroll_offset = float(self.lue.position_to_line[new_pos])
-                        self.lue.target_scroll_offset = self.lue.scroll_offset
-                        
-        except Exception:
-            pass
+        if 0 <= chapter_idx < len(self.lue.chapters):
+            self.lue.chapter_idx = chapter_idx
+            self.lue.paragraph_idx = 0
+            self.lue.sentence_idx = 0
+            
+            # Update UI state if available
+            if self._has_ui_idx:
+                self.lue.ui_chapter_idx = chapter_idx
+                self.lue.ui_paragraph_idx = 0
+                self.lue.ui_sentence_idx = 0
+            
+            # Update scroll position if available
+            if self._has_pos_map:
+                new_pos = (chapter_idx, 0, 0)
+                if new_pos in self.lue.position_to_line:
+                    self.lue.scroll_offset = float(self.lue.position_to_line[new_pos])
+                    self.lue.target_scroll_offset = self.lue.scroll_offset
     
     async def get_ai_response(self, question: str) -> str:
         """Get AI response for the given question."""
@@ -254,345 +555,265 @@ class TextualReaderAdapter:
     # Navigation methods that directly call the navigation logic
     def move_to_prev_paragraph(self) -> None:
         """Move to previous paragraph."""
-        try:
-            if hasattr(self.lue, '_handle_navigation_immediate'):
-                self.lue._handle_navigation_immediate('prev_paragraph')
-            else:
-                # Fallback: direct navigation
-                if self.lue.paragraph_idx > 0:
-                    self.lue.paragraph_idx -= 1
-                    self.lue.sentence_idx = 0
-                elif self.lue.chapter_idx > 0:
-                    self.lue.chapter_idx -= 1
-                    self.lue.paragraph_idx = len(self.lue.chapters[self.lue.chapter_idx]) - 1
-                    self.lue.sentence_idx = 0
-                self._update_ui_position()
-        except Exception:
-            pass
+        if self._has_nav_immediate:
+            self._run_deferring_save(self.lue._handle_navigation_immediate, 'prev_paragraph')
+        else:
+            # Fallback: direct navigation
+            if self.lue.paragraph_idx > 0:
+                self.lue.paragraph_idx -= 1
+                self.lue.sentence_idx = 0
+            elif self.lue.chapter_idx > 0:
+                self.lue.chapter_idx -= 1
+                self.lue.paragraph_idx = len(self.lue.chapters[self.lue.chapter_idx]) - 1
+                self.lue.sentence_idx = 0
+            self._update_ui_position()
     
     def move_to_next_paragraph(self) -> None:
         """Move to next paragraph."""
-        try:
-            if hasattr(self.lue, '_handle_navigation_immediate'):
-                self.lue._handle_navigation_immediate('next_paragraph')
-            else:
-                # Fallback: direct navigation
-                current_chapter = self.lue.chapters[self.lue.chapter_idx]
-                if self.lue.paragraph_idx < len(current_chapter) - 1:
-                    self.lue.paragraph_idx += 1
-                    self.lue.sentence_idx = 0
-                elif self.lue.chapter_idx < len(self.lue.chapters) - 1:
-                    self.lue.chapter_idx += 1
-                    self.lue.paragraph_idx = 0
-                    self.lue.sentence_idx = 0
-                self._update_ui_position()
-        except Exception:
-            pass
+        if self._has_nav_immediate:
+            self._run_deferring_save(self.lue._handle_navigation_immediate, 'next_paragraph')
+        else:
+            # Fallback: direct navigation
+            current_chapter = self.lue.chapters[self.lue.chapter_idx]
+            if self.lue.paragraph_idx < len(current_chapter) - 1:
+                self.lue.paragraph_idx += 1
+                self.lue.sentence_idx = 0
+            elif self.lue.chapter_idx < len(self.lue.chapters) - 1:
+                self.lue.chapter_idx += 1
+                self.lue.paragraph_idx = 0
+                self.lue.sentence_idx = 0
+            self._update_ui_position()
     
     def move_to_prev_sentence(self) -> None:
         """Move to previous sentence."""
-        try:
-            if hasattr(self.lue, '_handle_navigation_immediate'):
-                self.lue._handle_navigation_immediate('prev_sentence')
+        if self._has_nav_immediate:
+            self._run_deferring_save(self.lue._handle_navigation_immediate, 'prev_sentence')
+        else:
+            # Fallback: direct navigation
+            if self.lue.sentence_idx > 0:
+                self.lue.sentence_idx -= 1
             else:
-                # Fallback: direct navigation
-                from . import content_parser
-                if self.lue.sentence_idx > 0:
-                    self.lue.sentence_idx -= 1
-                else:
-                    # Move to previous paragraph
-                    self.move_to_prev_paragraph()
-                    # Set to last sentence of new paragraph
-                    current_para = self.lue.chapters[self.lue.chapter_idx][self.lue.paragraph_idx]
-                    sentences = content_parser.split_into_sentences(current_para)
-                    self.lue.sentence_idx = max(0, len(sentences) - 1)
-                self._update_ui_position()
-        except Exception:
-            pass
+                # Move to previous paragraph
+                self.move_to_prev_paragraph()
+                # Set to last sentence of new paragraph
+                sentences = self._get_sentences(self.lue.chapter_idx, self.lue.paragraph_idx)
+                self.lue.sentence_idx = max(0, len(sentences) - 1)
+            self._update_ui_position()
     
     def move_to_next_sentence(self) -> None:
         """Move to next sentence."""
-        try:
-            if hasattr(self.lue, '_handle_navigation_immediate'):
-                self.lue._handle_navigation_immediate('next_sentence')
+        if self._has_nav_immediate:
+            self._run_deferring_save(self.lue._handle_navigation_immediate, 'next_sentence')
+        else:
+            # Fallback: direct navigation
+            sentences = self._get_sentences(self.lue.chapter_idx, self.lue.paragraph_idx)
+            if self.lue.sentence_idx < len(sentences) - 1:
+                self.lue.sentence_idx += 1
             else:
-                # Fallback: direct navigation
-                from . import content_parser
-                current_para = self.lue.chapters[self.lue.chapter_idx][self.lue.paragraph_idx]
-                sentences = content_parser.split_into_sentences(current_para)
-                if self.lue.sentence_idx < len(sentences) - 1:
-                    self.lue.sentence_idx += 1
-                else:
-                    # Move to next paragraph
-                    self.move_to_next_paragraph()
-                self._update_ui_position()
-        except Exception:
-            pass
+                # Move to next paragraph
+                self.move_to_next_paragraph()
+            self._update_ui_position()
     
     def scroll_page_up(self) -> None:
         """Scroll page up."""
-        try:
-            # Stop auto scroll when manually scrolling
-            self.lue.auto_scroll_enabled = False
-            
-            # Adjust scroll offset
-            from . import ui
-            _, height = ui.get_terminal_size()
-            available_height = max(1, height - 4)
-            self.lue.scroll_offset = max(0, self.lue.scroll_offset - available_height)
-            self.lue.target_scroll_offset = self.lue.scroll_offset
-            
-            # Cancel smooth scroll if active
-            if hasattr(self.lue, 'smooth_scroll_task') and self.lue.smooth_scroll_task and not self.lue.smooth_scroll_task.done():
-                self.lue.smooth_scroll_task.cancel()
-            
-            # Update position tracking
-            self.lue.chapter_idx = getattr(self.lue, 'ui_chapter_idx', self.lue.chapter_idx)
-            self.lue.paragraph_idx = getattr(self.lue, 'ui_paragraph_idx', self.lue.paragraph_idx) 
-            self.lue.sentence_idx = getattr(self.lue, 'ui_sentence_idx', self.lue.sentence_idx)
-            
-            # Save progress
-            if hasattr(self.lue, '_save_extended_progress'):
-                self.lue._save_extended_progress()
-        except Exception:
-            pass
+        # Stop auto scroll when manually scrolling
+        self.lue.auto_scroll_enabled = False
+        
+        # Adjust scroll offset
+        available_height = self._get_available_height()
+        self.lue.scroll_offset = max(0, self.lue.scroll_offset - available_height)
+        self.lue.target_scroll_offset = self.lue.scroll_offset
+        
+        # Cancel smooth scroll if active
+        if self._has_smooth_scroll and self.lue.smooth_scroll_task and not self.lue.smooth_scroll_task.done():
+            self.lue.smooth_scroll_task.cancel()
+        
+        # Update position tracking
+        if self._has_ui_idx:
+            self.lue.chapter_idx = self.lue.ui_chapter_idx
+            self.lue.paragraph_idx = self.lue.ui_paragraph_idx
+            self.lue.sentence_idx = self.lue.ui_sentence_idx
+        
+        # Save progress
+        self._mark_save_dirty()
     
     def scroll_page_down(self) -> None:
         """Scroll page down."""
-        try:
-            # Stop auto scroll when manually scrolling
-            self.lue.auto_scroll_enabled = False
-            
-            # Adjust scroll offset
-            from . import ui
-            _, height = ui.get_terminal_size()
-            available_height = max(1, height - 4)
-            max_scroll = max(0, len(self.lue.document_lines) - available_height)
-            self.lue.scroll_offset = min(max_scroll, self.lue.scroll_offset + available_height)
-            self.lue.target_scroll_offset = self.lue.scroll_offset
-            
-            # Cancel smooth scroll if active
-            if hasattr(self.lue, 'smooth_scroll_task') and self.lue.smooth_scroll_task and not self.lue.smooth_scroll_task.done():
-                self.lue.smooth_scroll_task.cancel()
-            
-            # Update position tracking
-            self.lue.chapter_idx = getattr(self.lue, 'ui_chapter_idx', self.lue.chapter_idx)
-            self.lue.paragraph_idx = getattr(self.lue, 'ui_paragraph_idx', self.lue.paragraph_idx)
-            self.lue.sentence_idx = getattr(self.lue, 'ui_sentence_idx', self.lue.sentence_idx)
-            
-            # Save progress
-            if hasattr(self.lue, '_save_extended_progress'):
-                self.lue._save_extended_progress()
-        except Exception:
-            pass
+        # Stop auto scroll when manually scrolling
+        self.lue.auto_scroll_enabled = False
+        
+        # Adjust scroll offset
+        available_height = self._get_available_height()
+        max_scroll = max(0, len(self.lue.document_lines) - available_height)
+        self.lue.scroll_offset = _clamp(self.lue.scroll_offset + available_height, 0, max_scroll)
+        self.lue.target_scroll_offset = self.lue.scroll_offset
+        
+        # Cancel smooth scroll if active
+        if self._has_smooth_scroll and self.lue.smooth_scroll_task and not self.lue.smooth_scroll_task.done():
+            self.lue.smooth_scroll_task.cancel()
+        
+        # Update position tracking
+        if self._has_ui_idx:
+            self.lue.chapter_idx = self.lue.ui_chapter_idx
+            self.lue.paragraph_idx = self.lue.ui_paragraph_idx
+            self.lue.sentence_idx = self.lue.ui_sentence_idx
+        
+        # Save progress
+        self._mark_save_dirty()
     
     def scroll_up(self) -> None:
         """Scroll up."""
-        try:
-            # Use existing method if available
-            if hasattr(self.lue, '_handle_scroll_up_immediate'):
-                self.lue._handle_scroll_up_immediate()
-            else:
-                # Fallback: manual implementation
-                self.lue.auto_scroll_enabled = False
-                self.lue.scroll_offset = max(0, self.lue.scroll_offset - 1)
-                self.lue.target_scroll_offset = self.lue.scroll_offset
-                
-                # Cancel smooth scroll if active
-                if hasattr(self.lue, 'smooth_scroll_task') and self.lue.smooth_scroll_task and not self.lue.smooth_scroll_task.done():
-                    self.lue.smooth_scroll_task.cancel()
-                
-                # Update position tracking
-                self.lue.chapter_idx = getattr(self.lue, 'ui_chapter_idx', self.lue.chapter_idx)
-                self.lue.paragraph_idx = getattr(self.lue, 'ui_paragraph_idx', self.lue.paragraph_idx)
-                self.lue.sentence_idx = getattr(self.lue, 'ui_sentence_idx', self.lue.sentence_idx)
-                
-                # Save progress
-                if hasattr(self.lue, '_save_extended_progress'):
-                    self.lue._save_extended_progress()
-        except Exception:
-            pass
+        # Not delegated to lue._handle_scroll_up_immediate: it writes the
+        # progress file directly, on every line scrolled
+        self.lue.auto_scroll_enabled = False
+        self.lue.scroll_offset = max(0, self.lue.scroll_offset - 1)
+        self.lue.target_scroll_offset = self.lue.scroll_offset
+        
+        # Cancel smooth scroll if active
+        if self._has_smooth_scroll and self.lue.smooth_scroll_task and not self.lue.smooth_scroll_task.done():
+            self.lue.smooth_scroll_task.cancel()
+        
+        # Update position tracking
+        if self._has_ui_idx:
+            self.lue.chapter_idx = self.lue.ui_chapter_idx
+            self.lue.paragraph_idx = self.lue.ui_paragraph_idx
+            self.lue.sentence_idx = self.lue.ui_sentence_idx
+        
+        # Save progress
+        self._mark_save_dirty()
     
     def scroll_down(self) -> None:
         """Scroll down."""
-        try:
-            # Use existing method if available
-            if hasattr(self.lue, '_handle_scroll_down_immediate'):
-                self.lue._handle_scroll_down_immediate()
-            else:
-                # Fallback: manual implementation
-                self.lue.auto_scroll_enabled = False
-                from . import ui
-                _, height = ui.get_terminal_size()
-                available_height = max(1, height - 4)
-                max_scroll = max(0, len(self.lue.document_lines) - available_height)
-                self.lue.scroll_offset = min(max_scroll, self.lue.scroll_offset + 1)
-                self.lue.target_scroll_offset = self.lue.scroll_offset
-                
-                # Cancel smooth scroll if active
-                if hasattr(self.lue, 'smooth_scroll_task') and self.lue.smooth_scroll_task and not self.lue.smooth_scroll_task.done():
-                    self.lue.smooth_scroll_task.cancel()
-                
-                # Update position tracking
-                self.lue.chapter_idx = getattr(self.lue, 'ui_chapter_idx', self.lue.chapter_idx)
-                self.lue.paragraph_idx = getattr(self.lue, 'ui_paragraph_idx', self.lue.paragraph_idx)
-                self.lue.sentence_idx = getattr(self.lue, 'ui_sentence_idx', self.lue.sentence_idx)
-                
-                # Save progress
-                if hasattr(self.lue, '_save_extended_progress'):
-                    self.lue._save_extended_progress()
-        except Exception:
-            pass
+        # Not delegated to lue._handle_scroll_down_immediate, see scroll_up
+        self.lue.auto_scroll_enabled = False
+        available_height = self._get_available_height()
+        max_scroll = max(0, len(self.lue.document_lines) - available_height)
+        self.lue.scroll_offset = _clamp(self.lue.scroll_offset + 1, 0, max_scroll)
+        self.lue.target_scroll_offset = self.lue.scroll_offset
+        
+        # Cancel smooth scroll if active
+        if self._has_smooth_scroll and self.lue.smooth_scroll_task and not self.lue.smooth_scroll_task.done():
+            self.lue.smooth_scroll_task.cancel()
+        
+        # Update position tracking
+        if self._has_ui_idx:
+            self.lue.chapter_idx = self.lue.ui_chapter_idx
+            self.lue.paragraph_idx = self.lue.ui_paragraph_idx
+            self.lue.sentence_idx = self.lue.ui_sentence_idx
+        
+        # Save progress
+        self._mark_save_dirty()
     
     def move_to_beginning(self) -> None:
         """Move to beginning of book."""
-        try:
-            if hasattr(self.lue, '_handle_move_to_beginning_immediate'):
-                self.lue._handle_move_to_beginning_immediate()
-            else:
-                # Fallback: direct navigation
-                self.lue.chapter_idx = 0
-                self.lue.paragraph_idx = 0
-                self.lue.sentence_idx = 0
-                self.lue.scroll_offset = 0
-                self.lue.target_scroll_offset = 0
-                self._update_ui_position()
-        except Exception:
-            pass
+        if self._has_beginning_immediate:
+            self._run_deferring_save(self.lue._handle_move_to_beginning_immediate)
+        else:
+            # Fallback: direct navigation
+            self.lue.chapter_idx = 0
+            self.lue.paragraph_idx = 0
+            self.lue.sentence_idx = 0
+            self.lue.scroll_offset = 0
+            self.lue.target_scroll_offset = 0
+            self._update_ui_position()
     
     def move_to_end(self) -> None:
         """Move to end of book."""
-        try:
-            if hasattr(self.lue, '_handle_move_to_end_immediate'):
-                self.lue._handle_move_to_end_immediate()
-            else:
-                # Fallback: direct navigation
-                self.lue.chapter_idx = len(self.lue.chapters) - 1
-                self.lue.paragraph_idx = len(self.lue.chapters[self.lue.chapter_idx]) - 1
-                # Get last sentence
-                from . import content_parser
-                current_para = self.lue.chapters[self.lue.chapter_idx][self.lue.paragraph_idx]
-                sentences = content_parser.split_into_sentences(current_para)
-                self.lue.sentence_idx = max(0, len(sentences) - 1)
-                # Scroll to end
-                from . import ui
-                _, height = ui.get_terminal_size()
-                available_height = max(1, height - 4)
-                max_scroll = max(0, len(self.lue.document_lines) - available_height)
-                self.lue.scroll_offset = max_scroll
-                self.lue.target_scroll_offset = max_scroll
-                self._update_ui_position()
-        except Exception:
-            pass
+        if self._has_end_immediate:
+            self._run_deferring_save(self.lue._handle_move_to_end_immediate)
+        elif self.lue.chapters:
+            # Fallback: direct navigation
+            self.lue.chapter_idx = len(self.lue.chapters) - 1
+            self.lue.paragraph_idx = len(self.lue.chapters[self.lue.chapter_idx]) - 1
+            # Get last sentence
+            sentences = self._get_sentences(self.lue.chapter_idx, self.lue.paragraph_idx)
+            self.lue.sentence_idx = max(0, len(sentences) - 1)
+            # Scroll to end
+            available_height = self._get_available_height()
+            max_scroll = max(0, len(self.lue.document_lines) - available_height)
+            self.lue.scroll_offset = max_scroll
+            self.lue.target_scroll_offset = max_scroll
+            self._update_ui_position()
     
     def move_to_top_visible(self) -> None:
         """Move to top visible line."""
-        try:
-            # Find position at top of screen
-            start_line = int(self.lue.scroll_offset)
-            if (hasattr(self.lue, 'line_to_position') and 
-                start_line in self.lue.line_to_position):
-                new_pos = self.lue.line_to_position[start_line]
-                self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx = new_pos
-                self._update_ui_position()
-                
-                # Restart audio after navigation if not paused
-                self._restart_audio_after_navigation()
-        except Exception:
-            pass
+        # Find position at top of screen
+        start_line = int(self.lue.scroll_offset)
+        new_pos = None
+        if self._has_para_ranges:
+            new_pos = self._position_at_or_before_line(start_line)
+        if new_pos is not None:
+            self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx = new_pos
+            self._update_ui_position()
+            
+            # Restart audio after navigation if not paused
+            self._restart_audio_after_navigation()
     
     def toggle_pause(self) -> None:
         """Toggle TTS pause/resume."""
-        try:
-            self.lue.is_paused = not getattr(self.lue, 'is_paused', True)
-            # Save progress
-            if hasattr(self.lue, '_save_extended_progress'):
-                self.lue._save_extended_progress()
-        except Exception:
-            pass
+        self.lue.is_paused = not getattr(self.lue, 'is_paused', True)
+        # Save progress
+        if self._has_save:
+            self.lue._save_extended_progress()
     
     def toggle_auto_scroll(self) -> None:
         """Toggle auto scroll."""
-        try:
-            self.lue.auto_scroll_enabled = not getattr(self.lue, 'auto_scroll_enabled', False)
-            if self.lue.auto_scroll_enabled and hasattr(self.lue, '_scroll_to_position_immediate'):
-                self.lue._scroll_to_position_immediate(self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx)
-            # Save progress
-            if hasattr(self.lue, '_save_extended_progress'):
-                self.lue._save_extended_progress()
-        except Exception:
-            pass
+        self.lue.auto_scroll_enabled = not getattr(self.lue, 'auto_scroll_enabled', False)
+        if self.lue.auto_scroll_enabled and self._has_scroll_to_immediate:
+            self.lue._scroll_to_position_immediate(self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx)
+        # Save progress
+        if self._has_save:
+            self.lue._save_extended_progress()
     
     def _update_ui_position(self) -> None:
         """Update UI position tracking."""
-        try:
-            # Update UI state if available
-            if hasattr(self.lue, 'ui_chapter_idx'):
-                self.lue.ui_chapter_idx = self.lue.chapter_idx
-                self.lue.ui_paragraph_idx = self.lue.paragraph_idx
-                self.lue.ui_sentence_idx = self.lue.sentence_idx
-            
-            # Update scroll position if available
-            if hasattr(self.lue, 'position_to_line'):
-                new_pos = (self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx)
-                if new_pos in self.lue.position_to_line:
-                    target_line = self.lue.position_to_line[new_pos]
-                    from . import ui
-                    _, height = ui.get_terminal_size()
-                    available_height = max(1, height - 4)
-                    new_offset = max(0, target_line - available_height // 2)
-                    max_scroll = max(0, len(self.lue.document_lines) - available_height)
-                    self.lue.scroll_offset = min(new_offset, max_scroll)
-                    self.lue.target_scroll_offset = self.lue.scroll_offset
+        # Update UI state if available
+        if self._has_ui_idx:
+            self.lue.ui_chapter_idx = self.lue.chapter_idx
+            self.lue.ui_paragraph_idx = self.lue.paragraph_idx
+            self.lue.ui_sentence_idx = self.lue.sentence_idx
+        
+        # Update scroll position if available
+        if self._has_pos_map:
+            target_line = self._line_for_position(self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx)
+            if target_line >= 0:
+                available_height = self._get_available_height()
+                max_scroll = max(0, len(self.lue.document_lines) - available_height)
+                self.lue.scroll_offset = _clamp(target_line - available_height // 2, 0, max_scroll)
+                self.lue.target_scroll_offset = self.lue.scroll_offset
+        
+        # Save progress (ui indices were just synced above)
+        self._mark_save_dirty()
             
-            # Save progress
-            if hasattr(self.lue, '_save_extended_progress'):
-                self.lue._save_extended_progress(sync_audio_position=True)
-                
-            # Restart audio after navigation if not paused
-            self._restart_audio_after_navigation()
-        except Exception:
-            pass
+        # Restart audio after navigation if not paused
+        self._restart_audio_after_navigation()
     
     def _restart_audio_after_navigation(self) -> None:
         """Restart audio after navigation, similar to original implementation."""
-        try:
-            # Kill any existing audio playback first
-            self._kill_audio_immediately()
+        # Kill any existing audio playback first
+        self._kill_audio_immediately()
+        
+        # Only restart if TTS is available and not paused
+        if (self._has_tts_model and self.lue.tts_model and 
+            not getattr(self.lue, 'is_paused', True)):
             
-            # Only restart if TTS is available and not paused
-            if (hasattr(self.lue, 'tts_model') and self.lue.tts_model and 
-                not getattr(self.lue, 'is_paused', True)):
-                
-                # Use async restart if available
-                if hasattr(self.lue, '_restart_audio_after_navigation'):
-                    import asyncio
-                    if hasattr(self.lue, 'loop') and self.lue.loop:
-                        # Schedule the restart task
-                        if hasattr(self.lue, 'pending_restart_task'):
-                            self.lue.pending_restart_task = asyncio.create_task(self.lue._restart_audio_after_navigation())
-        except Exception:
-            pass
+            # Use async restart if available
+            if self._has_async_restart and self.lue.loop:
+                # Schedule the restart task
+                self.lue.pending_restart_task = asyncio.create_task(self.lue._restart_audio_after_navigation())
     
     def _kill_audio_immediately(self) -> None:
         """Kill audio playback immediately, similar to original implementation."""
         try:
-            import subprocess
-            
-            # Kill existing playback processes
-            if hasattr(self.lue, 'playback_processes'):
-                for process in self.lue.playback_processes[:]:
+            # Kill the playback processes we started; no need to scan for strays with pkill
+            if self._has_playback:
+                processes_to_kill = self.lue.playback_processes.copy()
+                self.lue.playback_processes.clear()
+                for process in processes_to_kill:
                     try:
                         process.kill()
                     except (ProcessLookupError, AttributeError):
                         pass
-            
-            # Kill any ffplay processes
-            try:
-                subprocess.run(['pkill', '-f', 'ffplay'], check=False, 
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
         except Exception:
             pass
 
@@ -602,24 +823,13 @@ def create_textual_adapter(lue_instance):
     adapter = TextualReaderAdapter(lue_instance)
     
     # Monkey-patch the adapter methods onto the lue instance
-    lue_instance.get_current_display_content = adapter.get_current_display_content
-    lue_instance.get_reading_progress = adapter.get_reading_progress
-    lue_instance.get_chapter_titles = adapter.get_chapter_titles
-    lue_instance.get_current_sentence = adapter.get_current_sentence
-    lue_instance.jump_to_chapter = adapter.jump_to_chapter
-    lue_instance.get_ai_response = adapter.get_ai_response
-    lue_instance.move_to_prev_paragraph = adapter.move_to_prev_paragraph
-    lue_instance.move_to_next_paragraph = adapter.move_to_next_paragraph
-    lue_instance.move_to_prev_sentence = adapter.move_to_prev_sentence
-    lue_instance.move_to_next_sentence = adapter.move_to_next_sentence
-    lue_instance.scroll_page_up = adapter.scroll_page_up
-    lue_instance.scroll_page_down = adapter.scroll_page_down
-    lue_instance.scroll_up = adapter.scroll_up
-    lue_instance.scroll_down = adapter.scroll_down
-    lue_instance.move_to_beginning = adapter.move_to_beginning
-    lue_instance.move_to_end = adapter.move_to_end
-    lue_instance.move_to_top_visible = adapter.move_to_top_visible
-    lue_instance.toggle_pause = adapter.toggle_pause
-    lue_instance.toggle_auto_scroll = adapter.toggle_auto_scroll
+    for name in _EXPORTED:
+        setattr(lue_instance, name, getattr(adapter, name))
+    adapter._refresh_capabilities()
+    
+    # Lue's navigation handlers save progress themselves; route those writes
+    # through the adapter so held keys do not write the file on every step
+    if adapter._has_save:
+        lue_instance._save_extended_progress = adapter._save_extended_progress
     
     return lue_instance
@@ -9,6 +9,7 @@ from textual.app import App, ComposeResult
 from textual.widgets import Footer
 from textual.binding import Binding
 
+from . import audio, content_parser, ui
 from . import reader as lue_reader
 from .tts.base import TTSBase
 from .textual_adapter import create_textual_adapter
@@ -119,13 +120,38 @@ class LueApp(App):
         Binding("q", "quit", "Quit"),
     ]
     
+    # Lue methods looked up once in __init__ (None when unavailable)
+    _CAPABILITIES = (
+        'move_to_prev_paragraph', 'move_to_next_paragraph',
+        'move_to_prev_sentence', 'move_to_next_sentence',
+        'scroll_page_up', 'scroll_page_down', 'scroll_up', 'scroll_down',
+        'move_to_beginning', 'move_to_end', 'move_to_top_visible',
+        'toggle_pause', 'toggle_auto_scroll', '_shutdown',
+    )
+    
+    # Quiet period after the last navigation key before audio restarts
+    AUDIO_RESTART_DELAY = 0.12
+    
     def __init__(self, file_path: str, tts_model: Optional[TTSBase] = None, overlap: Optional[float] = None):
         super().__init__()
         self.lue = lue_reader.Lue(file_path, tts_model, overlap)
         # Add Textual adapter methods to the lue instance
         create_textual_adapter(self.lue)
+        # Resolve the lue methods the actions dispatch to once, not per key press
+        self._caps = {name: getattr(self.lue, name, None) for name in self._CAPABILITIES}
+        self._has_ui_idx = hasattr(self.lue, 'ui_chapter_idx')
+        # Paragraphs per chapter for the navigation fallbacks; chapters are
+        # loaded once in Lue.__init__
+        self._chap_para_counts = [len(chapter) for chapter in self.lue.chapters]
+        # The reader widget, looked up once in on_mount
+        self._reader_widget = None
         self._tts_initialized = False
+        # The TTS model once initialization succeeded, None otherwise
+        self._tts_model = None
         self._ai_initialized = False
+        # Debounced audio restart; the generation marks which restart is current
+        self._audio_restart_timer = None
+        self._audio_restart_generation = 0
         
     def compose(self) -> ComposeResult:
         """Create the main application layout."""
@@ -134,7 +160,7 @@ class LueApp(App):
         
     async def on_mount(self) -> None:
         """Initialize the application."""
-        reader_widget = self.query_one(ReaderWidget)
+        reader_widget = self._reader_widget = self.query_one(ReaderWidget)
         reader_widget.current_position = (
             getattr(self.lue, 'chapter_idx', 0),
             getattr(self.lue, 'paragraph_idx', 0),
@@ -147,176 +173,175 @@ class LueApp(App):
     async def on_unmount(self) -> None:
         """Handle app shutdown by calling lue's shutdown method."""
         try:
-            if hasattr(self.lue, '_shutdown'):
-                await self.lue._shutdown()
+            shutdown = self._caps['_shutdown']
+            if shutdown:
+                await shutdown()
         except Exception:
             pass
         
     # Navigation actions
     def action_prev_paragraph(self) -> None:
         """Move to previous paragraph."""
-        try:
-            if hasattr(self.lue, 'move_to_prev_paragraph'):
-                self.lue.move_to_prev_paragraph()
-            else:
-                # Direct navigation fallback
-                if self.lue.paragraph_idx > 0:
-                    self.lue.paragraph_idx -= 1
-                    self.lue.sentence_idx = 0
-                elif self.lue.chapter_idx > 0:
-                    self.lue.chapter_idx -= 1
-                    self.lue.paragraph_idx = len(self.lue.chapters[self.lue.chapter_idx]) - 1
-                    self.lue.sentence_idx = 0
-            self._update_position()
-        except Exception:
-            pass
+        if not self._chap_para_counts:  # nothing loaded to navigate
+            return
+        move = self._caps['move_to_prev_paragraph']
+        if move:
+            move()
+        else:
+            # Direct navigation fallback
+            if self.lue.paragraph_idx > 0:
+                self.lue.paragraph_idx -= 1
+                self.lue.sentence_idx = 0
+            elif self.lue.chapter_idx > 0:
+                self.lue.chapter_idx -= 1
+                self.lue.paragraph_idx = self._chap_para_counts[self.lue.chapter_idx] - 1
+                self.lue.sentence_idx = 0
+        self._update_position()
             
     def action_next_paragraph(self) -> None:
         """Move to next paragraph."""
-        try:
-            if hasattr(self.lue, 'move_to_next_paragraph'):
-                self.lue.move_to_next_paragraph()
-            else:
-                # Direct navigation fallback
-                current_chapter = self.lue.chapters[self.lue.chapter_idx]
-                if self.lue.paragraph_idx < len(current_chapter) - 1:
-                    self.lue.paragraph_idx += 1
-                    self.lue.sentence_idx = 0
-                elif self.lue.chapter_idx < len(self.lue.chapters) - 1:
-                    self.lue.chapter_idx += 1
-                    self.lue.paragraph_idx = 0
-                    self.lue.sentence_idx = 0
-            self._update_position()
-        except Exception:
-            pass
+        if not self._chap_para_counts:  # nothing loaded to navigate
+            return
+        move = self._caps['move_to_next_paragraph']
+        if move:
+            move()
+        else:
+            # Direct navigation fallback
+            para_counts = self._chap_para_counts
+            if self.lue.paragraph_idx < para_counts[self.lue.chapter_idx] - 1:
+                self.lue.paragraph_idx += 1
+                self.lue.sentence_idx = 0
+            elif self.lue.chapter_idx < len(para_counts) - 1:
+                self.lue.chapter_idx += 1
+                self.lue.paragraph_idx = 0
+                self.lue.sentence_idx = 0
+        self._update_position()
             
     def action_prev_sentence(self) -> None:
         """Move to previous sentence."""
-        try:
-            if hasattr(self.lue, 'move_to_prev_sentence'):
-                self.lue.move_to_prev_sentence()
+        if not self._chap_para_counts:  # nothing loaded to navigate
+            return
+        move = self._caps['move_to_prev_sentence']
+        if move:
+            move()
+        else:
+            # Direct navigation fallback
+            if self.lue.sentence_idx > 0:
+                self.lue.sentence_idx -= 1
             else:
-                # Direct navigation fallback
-                from . import content_parser
-                if self.lue.sentence_idx > 0:
-                    self.lue.sentence_idx -= 1
-                else:
-                    # Move to previous paragraph
-                    self.action_prev_paragraph()
-                    # Set to last sentence of new paragraph
-                    current_para = self.lue.chapters[self.lue.chapter_idx][self.lue.paragraph_idx]
-                    sentences = content_parser.split_into_sentences(current_para)
-                    self.lue.sentence_idx = max(0, len(sentences) - 1)
-            self._update_position()
-        except Exception:
-            pass
+                # Move to previous paragraph
+                self.action_prev_paragraph()
+                # Set to last sentence of new paragraph
+                current_para = self.lue.chapters[self.lue.chapter_idx][self.lue.paragraph_idx]
+                sentences = content_parser.split_into_sentences_cached(current_para)
+                self.lue.sentence_idx = max(0, len(sentences) - 1)
+        self._update_position()
             
     def action_next_sentence(self) -> None:
         """Move to next sentence."""
-        try:
-            if hasattr(self.lue, 'move_to_next_sentence'):
-                self.lue.move_to_next_sentence()
+        if not self._chap_para_counts:  # nothing loaded to navigate
+            return
+        move = self._caps['move_to_next_sentence']
+        if move:
+            move()
+        else:
+            # Direct navigation fallback
+            current_para = self.lue.chapters[self.lue.chapter_idx][self.lue.paragraph_idx]
+            sentences = content_parser.split_into_sentences_cached(current_para)
+            if self.lue.sentence_idx < len(sentences) - 1:
+                self.lue.sentence_idx += 1
             else:
-                # Direct navigation fallback
-                from . import content_parser
-                current_para = self.lue.chapters[self.lue.chapter_idx][self.lue.paragraph_idx]
-                sentences = content_parser.split_into_sentences(current_para)
-                if self.lue.sentence_idx < len(sentences) - 1:
-                    self.lue.sentence_idx += 1
-                else:
-                    # Move to next paragraph
-                    self.action_next_paragraph()
-            self._update_position()
-        except Exception:
-            pass
+                # Move to next paragraph
+                self.action_next_paragraph()
+        self._update_position()
             
     # Scrolling actions
     def action_scroll_page_up(self) -> None:
         """Scroll page up."""
-        if hasattr(self.lue, 'scroll_page_up'):
-            self.lue.scroll_page_up()
+        action = self._caps['scroll_page_up']
+        if action:
+            action()
             self._update_position()
             
     def action_scroll_page_down(self) -> None:
         """Scroll page down."""
-        if hasattr(self.lue, 'scroll_page_down'):
-            self.lue.scroll_page_down()
+        action = self._caps['scroll_page_down']
+        if action:
+            action()
             self._update_position()
             
     def action_scroll_up(self) -> None:
         """Scroll up."""
-        if hasattr(self.lue, 'scroll_up'):
-            self.lue.scroll_up()
+        action = self._caps['scroll_up']
+        if action:
+            action()
             self._update_position()
             
     def action_scroll_down(self) -> None:
         """Scroll down."""
-        if hasattr(self.lue, 'scroll_down'):
-            self.lue.scroll_down()
+        action = self._caps['scroll_down']
+        if action:
+            action()
             self._update_position()
             
     # Jumping actions
     def action_move_to_beginning(self) -> None:
         """Move to beginning of book."""
-        if hasattr(self.lue, 'move_to_beginning'):
-            self.lue.move_to_beginning()
+        action = self._caps['move_to_beginning']
+        if action:
+            action()
             self._update_position()
             
     def action_move_to_end(self) -> None:
         """Move to end of book."""
-        if hasattr(self.lue, 'move_to_end'):
-            self.lue.move_to_end()
+        action = self._caps['move_to_end']
+        if action:
+            action()
             self._update_position()
             
     def action_move_to_top_visible(self) -> None:
         """Move to top visible line."""
-        if hasattr(self.lue, 'move_to_top_visible'):
-            self.lue.move_to_top_visible()
+        action = self._caps['move_to_top_visible']
+        if action:
+            action()
             self._update_position()
             
     # Control actions
     def action_pause(self) -> None:
         """Pause/resume TTS."""
-        try:
-            if hasattr(self.lue, 'toggle_pause'):
-                self.lue.toggle_pause()
-            else:
-                # Direct toggle fallback
-                self.lue.is_paused = not getattr(self.lue, 'is_paused', True)
-            
-            # Handle audio playback based on pause state
-            if self._tts_initialized:
-                asyncio.create_task(self._handle_audio_state_change())
-            
-            self._update_tts_status()
-        except Exception:
-            pass
+        toggle = self._caps['toggle_pause']
+        if toggle:
+            toggle()
+        else:
+            # Direct toggle fallback
+            self.lue.is_paused = not getattr(self.lue, 'is_paused', True)
+        
+        # Handle audio playback based on pause state
+        if self._tts_initialized:
+            asyncio.create_task(self._handle_audio_state_change())
+        
+        self._update_tts_status()
             
     def action_toggle_focus_mode(self) -> None:
         """Toggle focus mode (show only highlighted sentence)."""
-        try:
-            # Toggle state on the model
-            current = getattr(self.lue, 'focus_mode', False)
-            self.lue.focus_mode = not current
-            
-            # Refresh display and status
-            reader_widget = self.query_one(ReaderWidget)
-            reader_widget.update_content_display()
-            reader_widget.update_tts_status()
-        except Exception:
-            pass
+        # Toggle state on the model
+        current = getattr(self.lue, 'focus_mode', False)
+        self.lue.focus_mode = not current
+        
+        # Refresh display and status
+        reader_widget = self._reader_widget
+        reader_widget.update_content_display()
+        reader_widget.update_tts_status()
             
     def action_toggle_auto_scroll(self) -> None:
         """Toggle auto scroll."""
-        try:
-            if hasattr(self.lue, 'toggle_auto_scroll'):
-                self.lue.toggle_auto_scroll()
-            else:
-                # Direct toggle fallback
-                self.lue.auto_scroll_enabled = not getattr(self.lue, 'auto_scroll_enabled', False)
-            self._update_tts_status()
-        except Exception:
-            pass
+        toggle = self._caps['toggle_auto_scroll']
+        if toggle:
+            toggle()
+        else:
+            # Direct toggle fallback
+            self.lue.auto_scroll_enabled = not getattr(self.lue, 'auto_scroll_enabled', False)
+        self._update_tts_status()
             
     # Modal actions
     def action_show_toc(self) -> None:
@@ -338,46 +363,41 @@ class LueApp(App):
         
     def _update_position(self) -> None:
         """Update the reader widget position and restart audio if needed."""
-        try:
-            reader_widget = self.query_one(ReaderWidget)
-            reader_widget.current_position = (
-                getattr(self.lue, 'chapter_idx', 0),
-                getattr(self.lue, 'paragraph_idx', 0),
-                getattr(self.lue, 'sentence_idx', 0)
-            )
-            # Also update UI state if available
-            if hasattr(self.lue, 'ui_chapter_idx'):
-                self.lue.ui_chapter_idx = self.lue.chapter_idx
-                self.lue.ui_paragraph_idx = self.lue.paragraph_idx
-                self.lue.ui_sentence_idx = self.lue.sentence_idx
-            
-            # Restart audio after navigation if TTS is active
-            if self._tts_initialized:
-                asyncio.create_task(self._handle_navigation_audio_restart())
-        except Exception:
-            pass
+        reader_widget = self._reader_widget
+        position = (self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx)
+        # Also update UI state if available
+        if self._has_ui_idx:
+            self.lue.ui_chapter_idx, self.lue.ui_paragraph_idx, self.lue.ui_sentence_idx = position
+        
+        # No-op moves (e.g. holding a key at the end of the book) stop here
+        if position == reader_widget.current_position and not reader_widget.position_update_pending:
+            return
+        # The widget reads the position when the message is handled, so a
+        # burst of actions produces a single reactive update
+        reader_widget.queue_position_update()
+        
+        # Restart audio after navigation if TTS is active
+        if self._tts_initialized:
+            self._schedule_audio_restart()
             
     def _update_tts_status(self) -> None:
         """Update TTS status in reader widget."""
-        try:
-            reader_widget = self.query_one(ReaderWidget)
-            reader_widget.update_tts_status()
-        except Exception:
-            pass
+        self._reader_widget.update_tts_status()
 
     async def _initialize_services(self) -> None:
         """Initialize TTS and AI services in background."""
         try:
             # Set up the event loop for the lue instance
-            self.lue.loop = asyncio.get_event_loop()
+            self.lue.loop = asyncio.get_running_loop()
             
             # Initialize document layout
-            from . import ui
             ui.update_document_layout(self.lue)
             
             # Initialize TTS
             if not self._tts_initialized:
                 self._tts_initialized = await self.lue.initialize_tts()
+                # initialize_tts clears lue.tts_model when it fails
+                self._tts_model = self.lue.tts_model if self._tts_initialized else None
                 
             # Initialize AI Assistant
             if not self._ai_initialized:
@@ -389,7 +409,6 @@ class LueApp(App):
                 
             # Start audio playback if TTS is available and not paused
             if self._tts_initialized and not self.lue.is_paused:
-                from . import audio
                 await audio.play_from_current_position(self.lue)
                 
             # Update TTS status after initialization
@@ -401,25 +420,37 @@ class LueApp(App):
     async def _handle_audio_state_change(self) -> None:
         """Handle audio playback when pause state changes."""
         try:
-            from . import audio
-            
             if self.lue.is_paused:
                 # Stop audio when paused
                 await audio.stop_and_clear_audio(self.lue)
             else:
                 # Start audio when resumed
-                if self._tts_initialized and self.lue.tts_model:
+                if self._tts_model is not None:
                     await audio.play_from_current_position(self.lue)
         except Exception:
             pass
     
-    async def _handle_navigation_audio_restart(self) -> None:
-        """Restart audio after navigation if not paused."""
+    def _schedule_audio_restart(self) -> None:
+        """Restart audio once a burst of navigation settles, not once per key."""
+        self._audio_restart_generation += 1
+        generation = self._audio_restart_generation
+        if self._audio_restart_timer is not None:
+            self._audio_restart_timer.stop()
+        self._audio_restart_timer = self.set_timer(
+            self.AUDIO_RESTART_DELAY,
+            lambda: asyncio.create_task(self._handle_navigation_audio_restart(generation)),
+        )
+    
+    async def _handle_navigation_audio_restart(self, generation: int) -> None:
+        """Restart audio after navigation if not paused and no newer move is queued."""
         try:
-            if self._tts_initialized and not self.lue.is_paused and self.lue.tts_model:
-                from . import audio
+            if generation != self._audio_restart_generation:
+                return
+            if self._tts_model is not None and not self.lue.is_paused:
                 await audio.stop_and_clear_audio(self.lue)
                 await asyncio.sleep(0.1)  # Small delay for cleanup
+                if generation != self._audio_restart_generation:
+                    return  # Navigated again meanwhile; that restart plays instead
                 await audio.play_from_current_position(self.lue)
         except Exception:
             pass
@@ -429,25 +460,30 @@ class LueApp(App):
         try:
             # Store original _post_command_sync method
             original_post_command_sync = getattr(self.lue, '_post_command_sync', None)
+            # Runs after on_mount (from _initialize_services), so the widget is known
+            reader_widget = self._reader_widget
+            
+            def on_highlight_update(data):
+                # Update position and trigger Textual reactive update
+                if not self.lue.is_paused:
+                    self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx = data
+                    # Trigger Textual reactive update
+                    reader_widget.current_position = data
+            
+            # Commands that carry data, by name (same shape as lue's _cmd_handlers)
+            handlers = {'_update_highlight': on_highlight_update}
             
             def enhanced_post_command_sync(cmd):
                 # Call original method first
                 if original_post_command_sync:
                     original_post_command_sync(cmd)
                 
-                # Handle TTS highlight updates for Textual
-                if isinstance(cmd, tuple) and len(cmd) == 2:
-                    command_name, data = cmd
-                    if command_name == '_update_highlight':
-                        # Update position and trigger Textual reactive update
-                        if not self.lue.is_paused:
-                            self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx = data
-                            # Trigger Textual reactive update
-                            try:
-                                reader_widget = self.query_one(ReaderWidget)
-                                reader_widget.current_position = data
-                            except Exception:
-                                pass
+                # Handle TTS highlight updates for Textual; bare-string commands
+                # like 'quit' have nothing for the display to do
+                if type(cmd) is tuple and len(cmd) == 2:
+                    handler = handlers.get(cmd[0])
+                    if handler is not None:
+                        handler(cmd[1])
             
             # Replace the method
             self.lue._post_command_sync = enhanced_post_command_sync
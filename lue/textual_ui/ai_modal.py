@@ -3,10 +3,12 @@ AI Assistant modal for the Lue e-book reader Textual interface.
 Provides interactive AI assistance for understanding text content.
 """
 
+from collections import deque
 from typing import TYPE_CHECKING
+from textual import on
 from textual.screen import ModalScreen
 from textual.containers import Container
-from textual.widgets import Static
+from textual.widgets import Input, Static
 from textual.binding import Binding
 from textual.app import ComposeResult
 from rich.text import Text
@@ -20,18 +22,29 @@ class AIAssistantModal(ModalScreen):
     
     BINDINGS = [
         Binding("escape", "dismiss", "Close"),
-        Binding("ctrl+u", "clear_input", "Clear"),
-        Binding("enter", "send_message", "Send"),
     ]
     
+    INPUT_PLACEHOLDER = "Ask a question..."
+    ANSWER_PLACEHOLDER = "…"
+    # Exchanges kept in memory, and how many of the latest are shown
+    HISTORY_LIMIT = 50
+    VISIBLE_EXCHANGES = 3
+    
     def __init__(self, lue_instance: "lue_reader.Lue"):
         super().__init__()
         self.lue = lue_instance
-        self.input_buffer = ""
         self.sent_message = ""  # Store the message being processed
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=self.HISTORY_LIMIT)
+        self._recent = deque(maxlen=self.VISIBLE_EXCHANGES)  # exchanges on screen
         self.current_context = ""
         self.waiting_for_response = False
+        # Rendered conversation, extended in place as exchanges arrive
+        self._conversation_text = None
+        self._shown_exchanges = 0
+        # Child widgets, looked up once in on_mount
+        self._context_widget = None
+        self._conversation_widget = None
+        self._input_widget = None
         
     def compose(self) -> ComposeResult:
         """Create the AI Assistant interface."""
@@ -39,123 +52,135 @@ class AIAssistantModal(ModalScreen):
             yield Static("🤖 AI Assistant", id="ai-title")
             yield Static(id="ai-context")
             yield Static(id="ai-conversation")
-            yield Static(id="ai-input-display")
+            yield Input(placeholder=self.INPUT_PLACEHOLDER, id="ai-input")
             
     def on_mount(self) -> None:
         """Initialize AI Assistant when mounted."""
+        self._context_widget = self.query_one("#ai-context", Static)
+        self._conversation_widget = self.query_one("#ai-conversation", Static)
+        self._input_widget = self.query_one("#ai-input", Input)
         self.update_context_display()
         self.update_conversation_display()
-        self.update_input_display()
         
     def update_context_display(self) -> None:
         """Update the current sentence context."""
-        try:
-            context_widget = self.query_one("#ai-context", Static)
+        context_widget = self._context_widget
+        if context_widget is None:  # not mounted yet
+            return
+        
+        # Get current sentence from lue instance
+        if hasattr(self.lue, 'get_current_sentence'):
+            current_sentence = self.lue.get_current_sentence()
+        else:
+            current_sentence = "No sentence available"
             
-            # Get current sentence from lue instance
-            if hasattr(self.lue, 'get_current_sentence'):
-                current_sentence = self.lue.get_current_sentence()
-            else:
-                current_sentence = "No sentence available"
-                
-            self.current_context = current_sentence
-            context_content = Text(f"Current: {current_sentence[:100]}...", style="cyan")
-            context_widget.update(context_content)
-        except Exception:
-            pass
+        self.current_context = current_sentence
+        context_content = Text(f"Current: {current_sentence[:100]}...", style="cyan")
+        context_widget.update(context_content)
         
     def update_conversation_display(self) -> None:
         """Update the conversation history."""
-        try:
-            conv_widget = self.query_one("#ai-conversation", Static)
-            
-            if self.conversation_history:
-                conv_display = Text()
-                for i, entry in enumerate(self.conversation_history[-3:]):  # Show last 3 exchanges
-                    if i > 0:
-                        conv_display.append("\n")
-                    conv_display.append(f"Q: {entry['question']}", style="yellow")
-                    conv_display.append("\n")
-                    conv_display.append(f"A: {entry['answer']}", style="green")
-                    conv_display.append("\n")
-            else:
-                conv_display = Text("Ask a question about the current text...", style="dim")
-                
-            conv_widget.update(conv_display)
-        except Exception:
-            pass
-        
-    def update_input_display(self) -> None:
-        """Update the input buffer display."""
-        try:
-            input_widget = self.query_one("#ai-input-display", Static)
-            
-            if self.waiting_for_response:
-                # Show the sent message and waiting status
-                input_content = Text()
-                input_content.append(f"❯ {self.sent_message}", style="white")
-                input_content.append(" ", style="white")
-                input_content.append("(Waiting for AI response...)", style="yellow")
-            else:
-                cursor = "█" if len(self.input_buffer) % 2 == 0 else " "  # Blinking cursor effect
-                input_content = Text(f"❯ {self.input_buffer}{cursor}", style="white")
-                
-            input_widget.update(input_content)
-        except Exception:
-            pass
+        conv_widget = self._conversation_widget
+        if conv_widget is None:  # not mounted yet
+            return
         
-    def on_key(self, event) -> None:
-        """Handle key input for the AI assistant."""
-        if self.waiting_for_response:
-            return  # Ignore input while waiting for response
+        if self.conversation_history:
+            conv_display = Text()
+            self._conversation_text = conv_display
+            self._shown_exchanges = 0
+            for entry in self._recent:  # Show last exchanges, oldest first
+                self._append_exchange(entry)
+        else:
+            conv_display = Text("Ask a question about the current text...", style="dim")
+            self._conversation_text = None
+            self._shown_exchanges = 0
             
-        if event.key == "backspace":
-            if self.input_buffer:
-                self.input_buffer = self.input_buffer[:-1]
-                self.update_input_display()
-        elif event.character and event.character.isprintable():
-            self.input_buffer += event.character
-            self.update_input_display()
+        conv_widget.update(conv_display)
             
-    def action_clear_input(self) -> None:
-        """Clear the input buffer."""
-        if not self.waiting_for_response:
-            self.input_buffer = ""
-            self.update_input_display()
+    def _append_exchange(self, entry: dict) -> None:
+        """Append one Q/A pair to the rendered conversation."""
+        conv_display = self._conversation_text
+        if self._shown_exchanges:
+            conv_display.append("\n")
+        conv_display.append(f"Q: {entry['question']}", style="yellow")
+        conv_display.append("\n")
+        conv_display.append(f"A: {entry['answer']}", style="green")
+        conv_display.append("\n")
+        self._shown_exchanges += 1
         
-    async def action_send_message(self) -> None:
-        """Send message to AI assistant."""
-        if not self.input_buffer.strip() or self.waiting_for_response:
+    def _show_new_exchange(self, entry: dict) -> None:
+        """Add the newest exchange without re-rendering the ones already shown."""
+        if self._conversation_widget is None:  # not mounted yet
             return
-            
-        question = self.input_buffer.strip()
+        if self._conversation_text is None or self._shown_exchanges >= self.VISIBLE_EXCHANGES:
+            # First exchange, or the oldest visible one has to scroll away
+            self.update_conversation_display()
+            return
+        self._append_exchange(entry)
+        self._conversation_widget.update(self._conversation_text)
+        
+    def _show_answer(self, entry: dict) -> None:
+        """Replace the pending answer placeholder at the end of the conversation."""
+        if self._conversation_widget is None:  # not mounted yet
+            return
+        if self._conversation_text is None:
+            self.update_conversation_display()
+            return
+        conv_display = self._conversation_text
+        conv_display.right_crop(len(self.ANSWER_PLACEHOLDER) + 1)  # placeholder and its newline
+        conv_display.append(entry['answer'], style="green")
+        conv_display.append("\n")
+        self._conversation_widget.update(conv_display)
+        
+    def set_waiting(self, waiting: bool) -> None:
+        """Lock the input while a question is being answered."""
+        self.waiting_for_response = waiting
+        input_widget = self._input_widget
+        if input_widget is None:  # not mounted yet
+            return
+        input_widget.disabled = waiting
+        if waiting:
+            input_widget.placeholder = f"❯ {self.sent_message} (Waiting for AI response...)"
+        else:
+            input_widget.placeholder = self.INPUT_PLACEHOLDER
+            input_widget.focus()
+        
+    @on(Input.Submitted, "#ai-input")
+    def submit_question(self, event: Input.Submitted) -> None:
+        """Send the submitted question and clear the input field."""
+        question = event.value.strip()
+        if not question or self.waiting_for_response:
+            return
+        event.input.clear()
+        self.send_message(question)
+        
+    def send_message(self, question: str) -> None:
+        """Send message to AI assistant without blocking the screen's message loop."""
         self.sent_message = question  # Store the message being processed
-        self.input_buffer = ""
-        self.waiting_for_response = True
-        self.update_input_display()
+        self.set_waiting(True)
         
+        # Show the question right away; the worker fills in the answer
+        entry = {
+            'question': question,
+            'answer': self.ANSWER_PLACEHOLDER,
+            'context': self.current_context
+        }
+        self.conversation_history.append(entry)
+        self._recent.append(entry)
+        self._show_new_exchange(entry)
+        self.run_worker(self._fetch_answer(question, entry), exclusive=False)
+        
+    async def _fetch_answer(self, question: str, entry: dict) -> None:
+        """Await the AI response and store it on the pending conversation entry."""
         try:
             # Get AI response from lue instance
             if hasattr(self.lue, 'get_ai_response'):
-                answer = await self.lue.get_ai_response(question)
+                entry['answer'] = await self.lue.get_ai_response(question)
             else:
-                answer = "AI Assistant not configured. Please set up Gemini API key."
-                
-            # Add to conversation history
-            self.conversation_history.append({
-                'question': question,
-                'answer': answer,
-                'context': self.current_context
-            })
-            
+                entry['answer'] = "AI Assistant not configured. Please set up Gemini API key."
         except Exception as e:
-            self.conversation_history.append({
-                'question': question,
-                'answer': f"Error: {str(e)}",
-                'context': self.current_context
-            })
+            entry['answer'] = f"Error: {str(e)}"
         finally:
-            self.waiting_for_response = False
             self.sent_message = ""  # Clear the sent message
-            self.update_conversation_display()
-            self.update_input_display()
+            self.set_waiting(False)
+            self._show_answer(entry)
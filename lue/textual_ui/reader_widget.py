@@ -3,14 +3,18 @@ Reader widget for the Lue e-book reader Textual interface.
 Handles content display, progress tracking, and user interactions.
 """
 
+from array import array
+from bisect import bisect_right
+from functools import partial
+from itertools import accumulate
 from typing import Optional, TYPE_CHECKING
 from textual.widgets import Static
 from textual.containers import Vertical, Horizontal
 from textual.reactive import reactive
 from textual.events import Click, MouseScrollUp, MouseScrollDown
+from textual.message import Message
 from textual.app import ComposeResult
 from rich.text import Text
-from rich.console import Console
 
 if TYPE_CHECKING:
     from .. import reader as lue_reader
@@ -21,10 +25,80 @@ class ReaderWidget(Static):
     
     current_position = reactive((0, 0, 0))  # (chapter, paragraph, sentence)
     
+    class PositionChanged(Message, bubble=False):
+        """The lue position may have moved; read it when the message is handled."""
+        
+    class VisibleReady(Message, bubble=False):
+        """Visible lines computed in a worker thread for one content key."""
+        
+        def __init__(self, content_key: tuple, visible_lines: list) -> None:
+            super().__init__()
+            self.content_key = content_key
+            self.visible_lines = visible_lines
+            
+    class VisibleFailed(Message, bubble=False):
+        """Building visible lines in a worker thread raised for one content key."""
+        
+        def __init__(self, content_key: tuple, error: Exception) -> None:
+            super().__init__()
+            self.content_key = content_key
+            self.error = error
+    
+    # Minimum delay between redraws triggered by position changes (~30 fps)
+    FLUSH_INTERVAL = 0.033
+    # Current paragraphs longer than this are re-wrapped in a worker thread
+    LARGE_PARAGRAPH_CHARS = 20_000
+    
     def __init__(self, lue_instance: "lue_reader.Lue"):
         super().__init__()
         self.lue = lue_instance
-        self.console = Console()
+        # Position changes only mark parts dirty; a single timer redraws them
+        self._dirty = set()
+        self._flush_timer = None
+        # Set while a PositionChanged message is queued, so bursts post only one
+        self.position_update_pending = False
+        # Last frames pushed to the child widgets, to skip identical updates
+        self._last_content = None
+        self._last_progress = None
+        self._last_tts_state = None
+        # Inputs of the last get_visible_content call, to skip recomputing it
+        self._content_cache_key = None
+        self._visible_lines = None
+        self._visible_line_count = 0
+        # Content key a worker thread is currently building visible lines for
+        self._pending_content_key = None
+        # Per-paragraph wrapped line start offsets for click mapping, valid for
+        # one (layout_version, wrap width)
+        self._para_wrap_cache = {}
+        self._para_wrap_layout = None
+        # Child widgets, looked up once in on_mount
+        self._title_widget = None
+        self._progress_widget = None
+        self._content_widget = None
+        self._tts_widget = None
+        # Terminal size (and the wrap width derived from it), refreshed on resize
+        self._refresh_terminal_size()
+        self.invalidate_offsets()
+        
+    def _refresh_terminal_size(self) -> None:
+        """Re-read the terminal size; the layout code sizes everything from it."""
+        from ..ui import get_terminal_size
+        self._term_size = get_terminal_size()
+        self._available_width = max(20, self._term_size[0] - 10)
+        
+    def on_resize(self, event) -> None:
+        """Pick up the new terminal size and redraw with it."""
+        self._refresh_terminal_size()
+        self._mark_dirty('content', 'progress')
+        
+    def invalidate_offsets(self) -> None:
+        """Rebuild the per-chapter prefix sums; call when lue.chapters changes."""
+        # (starts, ends) character offsets of each paragraph's sentences
+        self._sentence_bounds_cache = {}
+        self._chapter_offsets = list(accumulate(
+            (len(chapter) for chapter in getattr(self.lue, 'chapters', [])), initial=0
+        ))
+        self._total_paragraphs = self._chapter_offsets[-1]
         
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -38,56 +112,185 @@ class ReaderWidget(Static):
         
     def on_mount(self) -> None:
         """Initialize widget when mounted."""
+        self._title_widget = self.query_one("#book-title", Static)
+        self._progress_widget = self.query_one("#progress-bar", Static)
+        self._content_widget = self.query_one("#content-display", Static)
+        self._tts_widget = self.query_one("#tts-status", Static)
         self.update_book_title()
         self.update_content_display()
         self.update_progress()
         self.update_tts_status()
         
     def watch_current_position(self, position: tuple) -> None:
-        """Update display when position changes."""
-        self.update_book_title()
-        self.update_content_display()
-        self.update_progress()
-        self.update_tts_status()
+        """Schedule a display update when position changes."""
+        self._mark_dirty('content', 'progress', 'tts')
+        
+    def queue_position_update(self) -> None:
+        """Sync current_position from lue once the queued actions have run."""
+        if self.position_update_pending:
+            return
+        self.position_update_pending = True
+        self.post_message(self.PositionChanged())
+        
+    def on_reader_widget_position_changed(self, message: PositionChanged) -> None:
+        """Apply the latest lue position for a burst of navigation actions."""
+        self.position_update_pending = False
+        self.current_position = (self.lue.chapter_idx, self.lue.paragraph_idx, self.lue.sentence_idx)
+        
+    def _mark_dirty(self, *parts: str) -> None:
+        """Coalesce bursts of updates into one redraw per interval."""
+        self._dirty.update(parts)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(self.FLUSH_INTERVAL, self._flush)
+            
+    def _flush(self) -> None:
+        """Redraw the dirty parts in one batch so Textual composites once."""
+        self._flush_timer = None
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = set()
+        with self.app.batch_update():
+            if 'content' in dirty:
+                self.update_content_display()
+            if 'progress' in dirty:
+                self.update_progress()
+            if 'tts' in dirty:
+                self.update_tts_status()
         
     def update_content_display(self) -> None:
         """Update the main content display with proper sentence highlighting."""
         try:
-            content_widget = self.query_one("#content-display", Static)
-            
             # Update UI position to match current position
             self.lue.ui_chapter_idx = self.lue.chapter_idx
             self.lue.ui_paragraph_idx = self.lue.paragraph_idx
             self.lue.ui_sentence_idx = self.lue.sentence_idx
             
-            # Get terminal height for proper content sizing
-            from ..ui import get_terminal_size, get_visible_content
-            _, height = get_terminal_size()
+            from ..ui import get_visible_content
             
             # Ensure document layout is updated
-            if not hasattr(self.lue, 'document_lines') or not self.lue.document_lines:
+            if not self.lue.layout_version:
                 from ..ui import update_document_layout
                 update_document_layout(self.lue)
             
-            # Use the original UI's get_visible_content which handles highlighting
-            visible_lines = get_visible_content(self.lue)
+            content_key = self._content_key()
+            if content_key == self._content_cache_key or content_key == self._pending_content_key:
+                return
             
-            # Convert visible lines to a single Text object with proper formatting
-            display_content = Text()
-            for i, line in enumerate(visible_lines):
-                if i > 0:
-                    display_content.append("\n")
-                # Ensure line is a Text object, not a string
-                if isinstance(line, str):
-                    display_content.append(Text(line))
-                else:
-                    display_content.append(line)
-                    
-            content_widget.update(display_content)
+            if self._current_paragraph_length() > self.LARGE_PARAGRAPH_CHARS:
+                # Keep the previous frame on screen while a worker wraps the paragraph
+                self._pending_content_key = content_key
+                self.run_worker(
+                    partial(self._compute_visible_lines, content_key),
+                    thread=True, exclusive=True, group="visible-content", exit_on_error=False,
+                )
+                return
+            self._pending_content_key = None
+            
+            visible_lines = self._restyle_current_paragraph(content_key)
+            if visible_lines is None:
+                # Use the original UI's get_visible_content which handles highlighting
+                visible_lines = get_visible_content(self.lue)
+            self._show_visible_lines(content_key, visible_lines)
         except Exception as e:
             # Graceful error handling
-            content_widget = self.query_one("#content-display", Static)
-            content_widget.update(Text(f"Error updating display: {str(e)}", style="red"))
+            self._show_display_error(e)
+            
+    def _show_display_error(self, error: Exception) -> None:
+        """Replace the content with an error frame and drop the cached window."""
+        self._content_cache_key = None
+        self._pending_content_key = None
+        self._visible_lines = None
+        self._last_content = None
+        self._content_widget.update(Text(f"Error updating display: {str(error)}", style="red"))
+        
+    def _show_visible_lines(self, content_key: tuple, visible_lines: list) -> None:
+        """Push visible lines built for content_key to the content widget."""
+        self._visible_lines = visible_lines
+        self._visible_line_count = len(visible_lines)
+        
+        # Join visible lines into a single Text object (strings become Text)
+        display_content = Text("\n").join(
+            Text(line) if isinstance(line, str) else line for line in visible_lines
+        )
+        
+        self._content_cache_key = content_key
+        # Text equality compares spans too, so a moved highlight still redraws
+        if display_content == self._last_content:
+            return
+        self._last_content = display_content
+        self._content_widget.update(display_content)
+        
+    def _current_paragraph_length(self) -> int:
+        """Characters in the paragraph that get_visible_content re-wraps."""
+        try:
+            return len(self.lue.chapters[self.lue.ui_chapter_idx][self.lue.ui_paragraph_idx])
+        except IndexError:
+            return 0
+        
+    def _compute_visible_lines(self, content_key: tuple) -> None:
+        """Worker thread body: build the visible lines and hand them to the UI thread."""
+        from ..ui import get_visible_content
+        try:
+            visible_lines = get_visible_content(self.lue)
+        except Exception as e:
+            # Hand the error to the UI thread so the pending key is released
+            self.post_message(self.VisibleFailed(content_key, e))
+            return
+        self.post_message(self.VisibleReady(content_key, visible_lines))
+        
+    def on_reader_widget_visible_ready(self, message: VisibleReady) -> None:
+        """Show worker-built lines unless the position has moved on since."""
+        if message.content_key != self._pending_content_key:
+            return
+        self._pending_content_key = None
+        if message.content_key != self._content_key():
+            # Stale by now; rebuild for the current position instead
+            self._mark_dirty('content')
+            return
+        self._show_visible_lines(message.content_key, message.visible_lines)
+        
+    def on_reader_widget_visible_failed(self, message: VisibleFailed) -> None:
+        """Show the error frame for the paragraph the worker failed to build."""
+        if message.content_key != self._pending_content_key:
+            return
+        self._show_display_error(message.error)
+        
+    def _content_key(self) -> tuple:
+        """Everything get_visible_content reads, with the layout version for relayouts."""
+        return (
+            self.lue.ui_chapter_idx, self.lue.ui_paragraph_idx, self.lue.ui_sentence_idx,
+            int(self.lue.scroll_offset), bool(getattr(self.lue, 'focus_mode', False)),
+            self.lue.layout_version, self._term_size,
+        )
+        
+    def _restyle_current_paragraph(self, content_key: tuple) -> Optional[list]:
+        """Re-wrap only the highlighted paragraph when just the sentence moved.
+        
+        Returns None when anything else changed, so the caller rebuilds the
+        whole window with get_visible_content.
+        """
+        last_key = self._content_cache_key
+        if (last_key is None or self._visible_lines is None or content_key[4]
+                or content_key[:2] != last_key[:2] or content_key[3:] != last_key[3:]):
+            return None
+        para_range = self.lue.paragraph_line_ranges.get(content_key[:2])
+        if para_range is None:
+            return None
+        
+        from ..ui import (
+            wrap_highlighted_paragraph, _apply_selection_highlighting, _apply_verse_number_styling,
+        )
+        highlighted = wrap_highlighted_paragraph(self.lue, self._available_width)
+        visible_lines = list(self._visible_lines)
+        start_line = content_key[3]
+        para_start, para_end = para_range
+        first = max(para_start, start_line)
+        last = min(para_end, start_line + len(visible_lines) - 1, para_start + len(highlighted) - 1)
+        for i in range(first, last + 1):
+            line = _apply_selection_highlighting(self.lue, highlighted[i - para_start], i)
+            visible_lines[i - start_line] = _apply_verse_number_styling(line)
+        return visible_lines
         
     def _get_fallback_content(self) -> Text:
         """Fallback content display method."""
@@ -101,47 +304,51 @@ class ReaderWidget(Static):
         
     def update_progress(self) -> None:
         """Update the progress bar with custom block characters."""
-        try:
-            progress_widget = self.query_one("#progress-bar", Static)
-            
-            # Calculate progress percentage
-            if hasattr(self.lue, 'get_reading_progress'):
-                progress = self.lue.get_reading_progress()
-            else:
-                # Fallback calculation
-                chapter_idx, para_idx, sent_idx = self.current_position
-                total_paragraphs = sum(len(chapter) for chapter in self.lue.chapters)
-                current_paragraph = sum(len(self.lue.chapters[i]) for i in range(chapter_idx)) + para_idx
-                progress = (current_paragraph / total_paragraphs * 100) if total_paragraphs > 0 else 0
-            
-            # Create custom progress bar with block characters
-            # Get available width for progress bar (estimate based on terminal width)
-            from ..ui import get_terminal_size
-            width, _ = get_terminal_size()
-            # Reserve space for book title and padding
-            available_width = max(10, width // 3)  # Roughly 1/3 of terminal width
-            
-            # Calculate filled and empty blocks
-            filled_blocks = int((progress / 100) * available_width)
-            empty_blocks = available_width - filled_blocks
-            
-            # Create progress bar string using block characters
-            progress_bar = "▓" * filled_blocks + "░" * empty_blocks
-            
-            # Add percentage text
-            progress_text = Text()
-            progress_text.append(progress_bar, style="cyan")
-            progress_text.append(f" {progress:.0f}%", style="dim")
-            
-            progress_widget.update(progress_text)
-        except Exception:
-            # Graceful error handling for progress bar
-            pass
+        progress_widget = self._progress_widget
+        if progress_widget is None:  # not mounted yet
+            return
+        
+        # Calculate progress percentage
+        if hasattr(self.lue, 'get_reading_progress'):
+            progress = self.lue.get_reading_progress()
+        else:
+            # Fallback calculation
+            chapter_idx, para_idx, sent_idx = self.current_position
+            total_paragraphs = self._total_paragraphs
+            current_paragraph = self._chapter_offsets[chapter_idx] + para_idx
+            progress = (current_paragraph / total_paragraphs * 100) if total_paragraphs > 0 else 0
+        
+        # Create custom progress bar with block characters
+        # Get available width for progress bar (estimate based on terminal width)
+        width = self._term_size[0]
+        # Reserve space for book title and padding
+        available_width = max(10, width // 3)  # Roughly 1/3 of terminal width
+        
+        # The label shows whole percents, so quantize once and skip
+        # the redraw unless that percent (or the bar width) changed
+        percent = round(progress)
+        if (percent, available_width) == self._last_progress:
+            return
+        self._last_progress = (percent, available_width)
+        
+        # Calculate filled and empty blocks
+        filled_blocks = percent * available_width // 100
+        empty_blocks = available_width - filled_blocks
+        
+        # Create progress bar string using block characters
+        progress_bar = "▓" * filled_blocks + "░" * empty_blocks
+        
+        # Add percentage text
+        progress_text = Text()
+        progress_text.append(progress_bar, style="cyan")
+        progress_text.append(f" {percent}%", style="dim")
+        
+        progress_widget.update(progress_text)
             
     def update_book_title(self) -> None:
         """Update the book title display."""
         try:
-            title_widget = self.query_one("#book-title", Static)
+            title_widget = self._title_widget
             
             # Get book title from the lue instance
             book_title = getattr(self.lue, 'book_title', None)
@@ -162,41 +369,46 @@ class ReaderWidget(Static):
             
     def update_tts_status(self) -> None:
         """Update TTS status display."""
-        try:
-            tts_widget = self.query_one("#tts-status", Static)
-            
-            # Get TTS status
-            is_paused = getattr(self.lue, 'is_paused', True)
-            has_tts = getattr(self.lue, 'tts_model', None) is not None
-            auto_scroll = getattr(self.lue, 'auto_scroll_enabled', False)
-            focus_mode = getattr(self.lue, 'focus_mode', False)
-            
-            # Build status line as Rich Text for per-part styling
-            status_text = Text()
+        tts_widget = self._tts_widget
+        if tts_widget is None:  # not mounted yet
+            return
+        
+        # Get TTS status
+        is_paused = getattr(self.lue, 'is_paused', True)
+        has_tts = getattr(self.lue, 'tts_model', None) is not None
+        auto_scroll = getattr(self.lue, 'auto_scroll_enabled', False)
+        focus_mode = getattr(self.lue, 'focus_mode', False)
+        
+        # Nothing shown on the status line changed (e.g. plain navigation)
+        tts_state = (has_tts, is_paused, auto_scroll, focus_mode)
+        if tts_state == self._last_tts_state:
+            return
+        
+        # Build status line as Rich Text for per-part styling
+        status_text = Text()
 
-            def append_part(part: str, style: str = "dim"):
-                if status_text.plain:
-                    status_text.append(" | ", style="dim")
-                status_text.append(part, style=style)
+        def append_part(part: str, style: str = "dim"):
+            if status_text.plain:
+                status_text.append(" | ", style="dim")
+            status_text.append(part, style=style)
 
-            # Playback status
-            if has_tts:
-                # Show shortcut key hint (p)
-                append_part("⏸️ Paused (p)" if is_paused else "▶️ Playing (p)", style="dim")
-            else:
-                append_part("🔇 No TTS", style="dim")
+        # Playback status
+        if has_tts:
+            # Show shortcut key hint (p)
+            append_part("⏸️ Paused (p)" if is_paused else "▶️ Playing (p)", style="dim")
+        else:
+            append_part("🔇 No TTS", style="dim")
 
-            # Scroll mode
-            # Show shortcut key hint (a)
-            append_part("📜 Auto (a)" if auto_scroll else "📖 Manual (a)", style="dim")
+        # Scroll mode
+        # Show shortcut key hint (a)
+        append_part("📜 Auto (a)" if auto_scroll else "📖 Manual (a)", style="dim")
 
-            # Focus indicator: always show; bold when on, dim when off
-            # Show shortcut key hint (f)
-            append_part("🎯 Focus (f)", style="bold" if focus_mode else "dim")
+        # Focus indicator: always show; bold when on, dim when off
+        # Show shortcut key hint (f)
+        append_part("🎯 Focus (f)", style="bold" if focus_mode else "dim")
 
-            tts_widget.update(status_text)
-        except Exception:
-            pass
+        tts_widget.update(status_text)
+        self._last_tts_state = tts_state
             
     def refresh_display(self) -> None:
         """Force refresh of the display."""
@@ -205,43 +417,35 @@ class ReaderWidget(Static):
             getattr(self.lue, 'paragraph_idx', 0),
             getattr(self.lue, 'sentence_idx', 0)
         )
-        self.update_tts_status()
+        self._mark_dirty('tts')
         
     def on_click(self, event: Click) -> None:
         """Handle mouse click events to change highlighted sentence."""
-        try:
-            # Get the content display widget
-            content_widget = self.query_one("#content-display", Static)
+        # Get click coordinates relative to the content widget
+        click_x = event.x
+        click_y = event.y
+        
+        # Find which sentence was clicked based on coordinates
+        new_position = self._find_sentence_at_position(click_x, click_y)
+        if new_position:
+            chapter_idx, paragraph_idx, sentence_idx = new_position
             
-            # Get click coordinates relative to the content widget
-            click_x = event.x
-            click_y = event.y
+            # Update the lue instance position
+            self.lue.chapter_idx = chapter_idx
+            self.lue.paragraph_idx = paragraph_idx
+            self.lue.sentence_idx = sentence_idx
             
-            # Find which sentence was clicked based on coordinates
-            new_position = self._find_sentence_at_position(click_x, click_y)
-            if new_position:
-                chapter_idx, paragraph_idx, sentence_idx = new_position
-                
-                # Update the lue instance position
-                self.lue.chapter_idx = chapter_idx
-                self.lue.paragraph_idx = paragraph_idx
-                self.lue.sentence_idx = sentence_idx
-                
-                # Update UI position
-                self.lue.ui_chapter_idx = chapter_idx
-                self.lue.ui_paragraph_idx = paragraph_idx
-                self.lue.ui_sentence_idx = sentence_idx
-                
-                # Update the display
-                self.current_position = (chapter_idx, paragraph_idx, sentence_idx)
-                
-                # Pause TTS to prevent reading during navigation
-                if hasattr(self.lue, 'is_paused'):
-                    self.lue.is_paused = True
-                    
-        except Exception as e:
-            # Graceful error handling
-            pass
+            # Update UI position
+            self.lue.ui_chapter_idx = chapter_idx
+            self.lue.ui_paragraph_idx = paragraph_idx
+            self.lue.ui_sentence_idx = sentence_idx
+            
+            # Update the display
+            self.current_position = (chapter_idx, paragraph_idx, sentence_idx)
+            
+            # Pause TTS to prevent reading during navigation
+            if hasattr(self.lue, 'is_paused'):
+                self.lue.is_paused = True
             
     def on_mouse_scroll_up(self, event: MouseScrollUp) -> None:
         """Handle trackpad/mouse wheel scroll up events."""
@@ -274,9 +478,7 @@ class ReaderWidget(Static):
     def _find_sentence_at_position(self, click_x: int, click_y: int) -> Optional[tuple]:
         """Find which sentence is at the given click position."""
         try:
-            # Get terminal dimensions and visible content area
-            from ..ui import get_terminal_size, get_visible_content
-            width, height = get_terminal_size()
+            from ..ui import get_visible_content
             
             # Account for panel padding and borders
             content_start_y = 2  # Panel title and top border
@@ -287,14 +489,17 @@ class ReaderWidget(Static):
             content_x = click_x - content_start_x
             
             # Ensure we have document layout
-            if not hasattr(self.lue, 'document_lines') or not self.lue.document_lines:
+            if not self.lue.layout_version:
                 from ..ui import update_document_layout
                 update_document_layout(self.lue)
             
-            # Get the visible content and find which line was clicked
-            visible_lines = get_visible_content(self.lue)
+            # Reuse the line count of the frame on screen when it is still current
+            if self._content_key() == self._content_cache_key:
+                visible_count = self._visible_line_count
+            else:
+                visible_count = len(get_visible_content(self.lue))
             
-            if content_y < 0 or content_y >= len(visible_lines):
+            if content_y < 0 or content_y >= visible_count:
                 return None
                 
             # Calculate which document line was clicked
@@ -322,99 +527,100 @@ class ReaderWidget(Static):
     def _find_sentence_in_paragraph(self, chapter_idx: int, paragraph_idx: int, 
                                    line_idx: int, char_pos: int) -> int:
         """Find which sentence in a paragraph corresponds to the click position."""
-        try:
-            from .. import content_parser
-            from ..ui import get_terminal_size
-            
-            # Get the paragraph text
-            if (chapter_idx >= len(self.lue.chapters) or 
-                paragraph_idx >= len(self.lue.chapters[chapter_idx])):
-                return 0
-                
-            paragraph = self.lue.chapters[chapter_idx][paragraph_idx]
-            sentences = content_parser.split_into_sentences(paragraph)
-            
-            if not sentences:
-                return 0
-            
-            # Get terminal width for text wrapping calculations
-            width, _ = get_terminal_size()
-            available_width = max(20, width - 10)
-            
-            # Calculate the absolute character position within the paragraph
-            # by reconstructing the wrapped text layout
-            absolute_char_pos = self._calculate_absolute_char_position(
-                chapter_idx, paragraph_idx, line_idx, char_pos, available_width
-            )
-            
-            # Find which sentence contains this character position
-            current_pos = 0
-            for sent_idx, sentence in enumerate(sentences):
-                sentence_start = current_pos
-                sentence_end = current_pos + len(sentence)
-                
-                # Check if the click position falls within this sentence
-                if sentence_start <= absolute_char_pos < sentence_end:
-                    return sent_idx
-                
-                # Move to next sentence (account for space between sentences)
-                current_pos = sentence_end
-                if sent_idx < len(sentences) - 1:
-                    current_pos += 1  # Space between sentences
-            
-            # If we didn't find a match, return the last sentence
-            return len(sentences) - 1
-            
-        except Exception:
+        # Get the paragraph text
+        if (chapter_idx >= len(self.lue.chapters) or 
+            paragraph_idx >= len(self.lue.chapters[chapter_idx])):
             return 0
             
+        paragraph = self.lue.chapters[chapter_idx][paragraph_idx]
+        starts, ends = self._sentence_bounds(chapter_idx, paragraph_idx, paragraph)
+        
+        if not ends:
+            return 0
+        
+        # Wrap width matching the document layout
+        available_width = self._available_width
+        
+        # Calculate the absolute character position within the paragraph
+        # by reconstructing the wrapped text layout
+        absolute_char_pos = self._calculate_absolute_char_position(
+            chapter_idx, paragraph_idx, line_idx, char_pos, available_width
+        )
+        
+        # First sentence ending after the click; it matches if it also starts
+        # at or before it (the space between sentences belongs to none)
+        sent_idx = bisect_right(ends, absolute_char_pos)
+        if sent_idx < len(ends) and starts[sent_idx] <= absolute_char_pos:
+            return sent_idx
+        
+        # If we didn't find a match, return the last sentence
+        return len(ends) - 1
+            
+    def _sentence_bounds(self, chapter_idx: int, paragraph_idx: int, paragraph: str) -> tuple:
+        """Start and end character offsets of each sentence in a paragraph."""
+        key = (chapter_idx, paragraph_idx)
+        bounds = self._sentence_bounds_cache.get(key)
+        if bounds is None:
+            from .. import content_parser
+            starts, ends = array('i'), array('i')
+            current_pos = 0
+            for sentence in content_parser.split_into_sentences_cached(paragraph):
+                starts.append(current_pos)
+                ends.append(current_pos + len(sentence))
+                current_pos += len(sentence) + 1  # Space between sentences
+            bounds = self._sentence_bounds_cache[key] = (starts, ends)
+        return bounds
+        
+    def _wrapped_line_starts(self, chapter_idx: int, paragraph_idx: int,
+                             paragraph: str, available_width: int) -> array:
+        """Start offset of each wrapped line of a paragraph, plus one past the end.
+        
+        Line i spans starts[i] to starts[i + 1] - 1; the extra character is the
+        break between lines. Wrapping is done once per paragraph and layout.
+        """
+        layout = (self.lue.layout_version, available_width)
+        if layout != self._para_wrap_layout:
+            self._para_wrap_cache.clear()
+            self._para_wrap_layout = layout
+            
+        key = (chapter_idx, paragraph_idx)
+        line_starts = self._para_wrap_cache.get(key)
+        if line_starts is None:
+            # Process verse markers and wrap like the UI does
+            from ..ui import _process_verse_markers
+            wrapped_lines = _process_verse_markers(paragraph).wrap(self.lue.console, available_width)
+            line_starts = array('i', accumulate((len(line.plain) + 1 for line in wrapped_lines), initial=0))
+            self._para_wrap_cache[key] = line_starts
+        return line_starts
+        
     def _calculate_absolute_char_position(self, chapter_idx: int, paragraph_idx: int,
                                         line_idx: int, char_pos: int, available_width: int) -> int:
         """Calculate the absolute character position within a paragraph from click coordinates."""
-        try:
-            # Get paragraph text and wrap it to see how it's displayed
-            paragraph = self.lue.chapters[chapter_idx][paragraph_idx]
+        if (chapter_idx >= len(self.lue.chapters) or
+                paragraph_idx >= len(self.lue.chapters[chapter_idx])):
+            return 0
             
-            # Process verse markers like the UI does
-            from ..ui import _process_verse_markers
-            styled_text = _process_verse_markers(paragraph)
-            wrapped_lines = styled_text.wrap(self.lue.console, available_width)
+        paragraph = self.lue.chapters[chapter_idx][paragraph_idx]
+        line_starts = self._wrapped_line_starts(chapter_idx, paragraph_idx, paragraph, available_width)
+        line_count = len(line_starts) - 1
+        
+        # Get paragraph line range
+        paragraph_key = (chapter_idx, paragraph_idx)
+        if (hasattr(self.lue, 'paragraph_line_ranges') and 
+            paragraph_key in self.lue.paragraph_line_ranges):
             
-            # Get paragraph line range
-            paragraph_key = (chapter_idx, paragraph_idx)
-            if (hasattr(self.lue, 'paragraph_line_ranges') and 
-                paragraph_key in self.lue.paragraph_line_ranges):
-                
-                para_start, para_end = self.lue.paragraph_line_ranges[paragraph_key]
-                line_offset = line_idx - para_start
-                
-                # Ensure line_offset is within bounds
-                if line_offset < 0 or line_offset >= len(wrapped_lines):
-                    return 0
-                
-                # Calculate character position by summing up characters in previous lines
-                # plus the character position within the current line
-                total_chars = 0
-                
-                # Add characters from all previous lines in this paragraph
-                for i in range(line_offset):
-                    if i < len(wrapped_lines):
-                        total_chars += len(wrapped_lines[i].plain)
-                        # Account for line breaks (except for the last line)
-                        if i < len(wrapped_lines) - 1:
-                            total_chars += 1
-                
-                # Add the character position within the current line
-                if line_offset < len(wrapped_lines):
-                    current_line = wrapped_lines[line_offset]
-                    # Clamp char_pos to the actual line length
-                    line_char_pos = min(char_pos, len(current_line.plain))
-                    total_chars += max(0, line_char_pos)
-                
-                return total_chars
+            para_start, para_end = self.lue.paragraph_line_ranges[paragraph_key]
+            line_offset = line_idx - para_start
             
-            # Fallback: simple estimation
-            return min(char_pos, len(paragraph))
+            # Ensure line_offset is within bounds
+            if line_offset < 0 or line_offset >= line_count:
+                return 0
             
-        except Exception:
-            return 0
+            # Characters (and line breaks) before the clicked line, plus the
+            # position within it clamped to the line length
+            line_start = line_starts[line_offset]
+            line_length = line_starts[line_offset + 1] - line_start - 1
+            return line_start + max(0, min(char_pos, line_length))
+        
+        # Fallback: simple estimation
+        return min(char_pos, len(paragraph))
@@ -9,11 +9,26 @@ from textual.containers import Container
 from textual.widgets import Static
 from textual.binding import Binding
 from textual.app import ComposeResult
+from rich.style import Style
 from rich.text import Text
 
 if TYPE_CHECKING:
     from .. import reader as lue_reader
 
+# Row styles parsed once instead of per appended row
+_SELECTED = Style.parse("bold yellow on blue")
+_CURRENT = Style.parse("bold green")
+_NORMAL = Style.parse("white")
+_DIM = Style.parse("dim")
+
+# Row prefixes keyed by (is current chapter, is selected)
+_PREFIXES = {
+    (True, True): "●▶ ",
+    (True, False): "●  ",
+    (False, True): " ▶ ",
+    (False, False): "   ",
+}
+
 
 class TOCModal(ModalScreen):
     """Enhanced Table of Contents modal with better space utilization."""
@@ -38,6 +53,19 @@ class TOCModal(ModalScreen):
         self.selected_chapter = getattr(lue_instance, 'chapter_idx', 0)
         # Dynamic scrolling - will be calculated based on actual screen size
         self.toc_scroll_offset = 0
+        # Chapter titles (row i is chapter i), loaded once per modal
+        self.chapter_titles_list = None
+        self._plain_rows = None
+        self._load_chapter_index()
+        # (window, selection, current chapter) of the last rendered TOC frame
+        self._toc_frame_key = None
+        self._footer_chapter = None
+        # Set while a redraw is queued by _mark_toc_dirty
+        self._toc_dirty = False
+        # Child widgets, looked up once in on_mount
+        self._container = None
+        self._toc_widget = None
+        self._footer_widget = None
         
     def compose(self) -> ComposeResult:
         """Create the TOC interface with better layout."""
@@ -48,31 +76,29 @@ class TOCModal(ModalScreen):
             
     def on_mount(self) -> None:
         """Initialize TOC content when mounted."""
+        self._container = self.query_one("#toc-container", Container)
+        self._toc_widget = self.query_one("#toc-content", Static)
+        self._footer_widget = self.query_one("#toc-footer", Static)
         self.update_toc_display()
         
     def on_resize(self) -> None:
         """Handle screen resize by updating display."""
-        self.update_toc_display()
+        if self._toc_widget is not None:
+            self.update_toc_display()
         
     def update_toc_display(self) -> None:
         """Update the TOC content display with dynamic height calculation."""
         try:
-            toc_widget = self.query_one("#toc-content", Static)
-            footer_widget = self.query_one("#toc-footer", Static)
+            toc_widget = self._toc_widget
+            footer_widget = self._footer_widget
             
             # Get actual available height from the container
-            container = self.query_one("#toc-container", Container)
+            container = self._container
             available_height = container.size.height - 4  # Account for title, footer, and borders
             
-            # Get chapter titles using the existing content parser
-            from .. import content_parser
-            file_path = getattr(self.lue, 'file_path', None)
-            if hasattr(self.lue, 'chapters') and self.lue.chapters:
-                chapter_titles = content_parser.extract_chapter_titles(self.lue.chapters, file_path)
-            else:
-                chapter_titles = [(i, f"Chapter {i+1}") for i in range(len(getattr(self.lue, 'chapters', [])))]
+            titles_list = self.chapter_titles_list
             
-            total_chapters = len(chapter_titles)
+            total_chapters = len(titles_list)
             if total_chapters == 0:
                 toc_widget.update(Text("No chapters available", style="dim"))
                 footer_widget.update(Text("", style="dim"))
@@ -81,151 +107,148 @@ class TOCModal(ModalScreen):
             # Calculate how many chapters can fit on screen
             visible_height = max(5, available_height - 2)  # Reserve space for scroll indicators
             
-            # Smart scrolling: keep selected chapter visible and centered when possible
-            if total_chapters <= visible_height:
-                # All chapters fit on screen
-                self.toc_scroll_offset = 0
-                start_idx = 0
-                end_idx = total_chapters
-            else:
-                # Need scrolling - center the selected chapter
-                center_offset = visible_height // 2
-                ideal_start = max(0, self.selected_chapter - center_offset)
-                ideal_end = min(total_chapters, ideal_start + visible_height)
-                
-                # Adjust if we're near the end
-                if ideal_end == total_chapters:
-                    ideal_start = max(0, total_chapters - visible_height)
-                
-                self.toc_scroll_offset = ideal_start
-                start_idx = ideal_start
-                end_idx = ideal_end
+            # Smart scrolling: center the selected chapter when possible, clamped so
+            # the window never runs past the last chapter (offset 0 if all fit)
+            max_offset = max(0, total_chapters - visible_height)
+            start_idx = min(max(0, self.selected_chapter - visible_height // 2), max_offset)
+            end_idx = min(total_chapters, start_idx + visible_height)
+            self.toc_scroll_offset = start_idx
             
-            # Build TOC display
-            toc_lines = []
             current_chapter = getattr(self.lue, 'chapter_idx', 0)
+            frame_key = (start_idx, end_idx, self.selected_chapter, current_chapter)
+            if frame_key == self._toc_frame_key:
+                # Resizes and no-op cursor moves keep showing the same frame
+                return
+            
+            # Build TOC display directly into one Text frame (one span per row)
+            toc_display = Text()
             
             # Add scroll indicator at top if needed
             if self.toc_scroll_offset > 0:
-                toc_lines.append((f"  ↑ {self.toc_scroll_offset} more above", "dim"))
+                toc_display.append(f"  ↑ {self.toc_scroll_offset} more above\n", style=_DIM)
             
-            # Display chapters
+            # Display chapters; only the current and selected rows differ from
+            # the prebuilt plain rows
+            plain_rows = self._plain_rows
             for i in range(start_idx, end_idx):
-                if i >= len(chapter_titles):
+                if i >= total_chapters:
                     break
                     
-                chapter_idx, title = chapter_titles[i]
-                
-                # Indicators
-                current_indicator = "●" if i == current_chapter else " "
-                selection_indicator = "▶" if i == self.selected_chapter else " "
+                is_current = i == current_chapter
+                is_selected = i == self.selected_chapter
+                if not (is_current or is_selected):
+                    toc_display.append(plain_rows[i], style=_NORMAL)
+                    continue
                 
                 # Style based on selection and current position
-                if i == self.selected_chapter:
-                    style = "bold yellow on blue"
-                elif i == current_chapter:
-                    style = "bold green"
-                else:
-                    style = "white"
-                
-                # Format with proper spacing
-                line_text = f"{current_indicator}{selection_indicator} {title}"
-                toc_lines.append((line_text, style))
+                style = _SELECTED if is_selected else _CURRENT
+                toc_display.append(_PREFIXES[(is_current, is_selected)] + titles_list[i] + "\n", style=style)
             
             # Add scroll indicator at bottom if needed
             if end_idx < total_chapters:
                 remaining = total_chapters - end_idx
-                toc_lines.append((f"  ↓ {remaining} more below", "dim"))
+                toc_display.append(f"  ↓ {remaining} more below\n", style=_DIM)
             
-            # Build the final display text
-            toc_display = Text()
-            for i, (line_text, style) in enumerate(toc_lines):
-                if i > 0:
-                    toc_display.append("\n")
-                toc_display.append(line_text, style=style)
-                
+            # Drop the trailing newline of the last row
+            toc_display.right_crop(1)
             toc_widget.update(toc_display)
+            self._toc_frame_key = frame_key
+            
+            # The footer only depends on the current chapter; skip the O(chapters)
+            # title lookup while the cursor moves
+            if current_chapter == self._footer_chapter:
+                return
+            self._footer_chapter = current_chapter
             
             # Update footer with navigation info
             current_title = ""
-            for idx, title in chapter_titles:
-                if idx == current_chapter:
-                    current_title = title
-                    break
+            if 0 <= current_chapter < total_chapters:
+                current_title = titles_list[current_chapter]
             
             footer_text = f"Current: {current_title} ({current_chapter + 1}/{total_chapters}) | [↑↓] Navigate [Enter] Jump [Esc] Close"
             footer_widget.update(Text(footer_text, style="dim"))
             
         except Exception as e:
-            toc_widget = self.query_one("#toc-content", Static)
+            self._toc_frame_key = None
+            self._footer_chapter = None
+            toc_widget = self._toc_widget
             toc_widget.update(Text(f"Error updating TOC: {str(e)}", style="red"))
         
+    def _load_chapter_index(self) -> None:
+        """Load the chapter titles and prebuild their plain TOC rows."""
+        # The adapter caches the titles for the book, so reopening the TOC
+        # does not re-extract them; extract_chapter_titles numbers entries
+        # 0..n-1, so the list index is the chapter index
+        if hasattr(self.lue, 'get_chapter_titles'):
+            self.chapter_titles_list = self.lue.get_chapter_titles()
+        else:
+            self.chapter_titles_list = [f"Chapter {i+1}" for i in range(len(getattr(self.lue, 'chapters', [])))]
+            
+        plain_prefix = _PREFIXES[(False, False)]
+        self._plain_rows = [plain_prefix + title + "\n" for title in self.chapter_titles_list]
+        
+    def _last_chapter(self) -> int:
+        """Index of the last selectable TOC row, from the cached title list."""
+        return len(self.chapter_titles_list) - 1
+        
+    def _mark_toc_dirty(self) -> None:
+        """Redraw once after the next refresh, however many keys arrive before it."""
+        if self._toc_dirty:
+            return
+        self._toc_dirty = True
+        self.call_after_refresh(self._flush_toc)
+        
+    def _flush_toc(self) -> None:
+        """Apply the latest selection to the TOC display."""
+        if self._toc_dirty:
+            self._toc_dirty = False
+            self.update_toc_display()
+            
     def action_cursor_up(self) -> None:
         """Move selection up with scrolling support."""
         if self.selected_chapter > 0:
             self.selected_chapter -= 1
-            self.update_toc_display()
+            self._mark_toc_dirty()
             
     def action_cursor_down(self) -> None:
         """Move selection down with scrolling support."""
-        # Get actual chapter count from titles
-        from .. import content_parser
-        file_path = getattr(self.lue, 'file_path', None)
-        if hasattr(self.lue, 'chapters') and self.lue.chapters:
-            chapter_titles = content_parser.extract_chapter_titles(self.lue.chapters, file_path)
-            max_chapters = len(chapter_titles) - 1
-        else:
-            max_chapters = len(getattr(self.lue, 'chapters', [])) - 1
-            
-        if self.selected_chapter < max_chapters:
+        if self.selected_chapter < self._last_chapter():
             self.selected_chapter += 1
-            self.update_toc_display()
+            self._mark_toc_dirty()
             
     def action_go_to_top(self) -> None:
         """Jump to first chapter."""
         self.selected_chapter = 0
-        self.update_toc_display()
+        self._mark_toc_dirty()
         
     def action_go_to_bottom(self) -> None:
         """Jump to last chapter."""
-        from .. import content_parser
-        file_path = getattr(self.lue, 'file_path', None)
-        if hasattr(self.lue, 'chapters') and self.lue.chapters:
-            chapter_titles = content_parser.extract_chapter_titles(self.lue.chapters, file_path)
-            self.selected_chapter = len(chapter_titles) - 1
-        else:
-            self.selected_chapter = len(getattr(self.lue, 'chapters', [])) - 1
-        self.update_toc_display()
+        self.selected_chapter = self._last_chapter()
+        self._mark_toc_dirty()
         
     def action_page_up(self) -> None:
         """Move selection up by a page."""
         # Get actual available height
-        container = self.query_one("#toc-container", Container)
+        container = self._container
         available_height = container.size.height - 4
         visible_height = max(5, available_height - 2)
         page_size = max(1, visible_height // 2)
         
         self.selected_chapter = max(0, self.selected_chapter - page_size)
-        self.update_toc_display()
+        self._mark_toc_dirty()
         
     def action_page_down(self) -> None:
         """Move selection down by a page."""
-        from .. import content_parser
-        file_path = getattr(self.lue, 'file_path', None)
-        if hasattr(self.lue, 'chapters') and self.lue.chapters:
-            chapter_titles = content_parser.extract_chapter_titles(self.lue.chapters, file_path)
-            max_chapters = len(chapter_titles) - 1
-        else:
-            max_chapters = len(getattr(self.lue, 'chapters', [])) - 1
-            
+        max_chapters = self._last_chapter()
+        
         # Get actual available height
-        container = self.query_one("#toc-container", Container)
+        container = self._container
         available_height = container.size.height - 4
         visible_height = max(5, available_height - 2)
         page_size = max(1, visible_height // 2)
         
         self.selected_chapter = min(max_chapters, self.selected_chapter + page_size)
-        self.update_toc_display()
+        self._mark_toc_dirty()
             
     def action_select_chapter(self) -> None:
         """Jump to selected chapter."""
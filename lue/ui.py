@@ -8,20 +8,23 @@ from .ui_theme import ICONS, COLORS
 import re
 from .ui_utils import get_terminal_size, create_progress_bar, truncate_text
 
+# Verse number markers left in the text by the content parser
+_VERSE_RE = re.compile(r'__VERSE__(\d+)__/VERSE__')
+# Leading verse-like numbers at the start of a wrapped line
+_LEADING_VERSE_NUMBER_RE = re.compile(r"^\s*(\d{1,3})([).:]?)\s?")
+
 
 def _process_verse_markers(text):
     """Process verse number markers and apply appropriate styling"""
     styled_text = Text()
     
-    # Split text by verse markers
-    parts = re.split(r'(__VERSE__\d+__/VERSE__)', text)
+    # Split text by verse markers; the captured verse numbers land at odd indices
+    parts = _VERSE_RE.split(text)
     
-    for part in parts:
-        if re.match(r'__VERSE__\d+__/VERSE__', part):
-            # Extract verse number
-            verse_num = re.search(r'__VERSE__(\d+)__/VERSE__', part).group(1)
+    for i, part in enumerate(parts):
+        if i % 2:
             # Style verse number with cyan dim (small and less prominent)
-            styled_text.append(verse_num, style="cyan dim")
+            styled_text.append(part, style="cyan dim")
             styled_text.append(" ")  # Add space after verse number
         else:
             # Regular text
@@ -36,6 +39,7 @@ def update_document_layout(reader):
     reader.line_to_position = {}
     reader.position_to_line = {}
     reader.paragraph_line_ranges = {}
+    reader.layout_version = getattr(reader, 'layout_version', 0) + 1
 
     width, _ = get_terminal_size()
     available_width = max(20, width - 10)
@@ -56,7 +60,7 @@ def update_document_layout(reader):
             reader.paragraph_line_ranges[(chap_idx, para_idx)] = (paragraph_start_line, paragraph_end_line)
 
             # Map sentences to their positions within the wrapped text
-            sentences = content_parser.split_into_sentences(paragraph)
+            sentences = content_parser.split_into_sentences_cached(paragraph)
             current_char_pos = 0
             
             for sent_idx, sentence in enumerate(sentences):
@@ -137,7 +141,7 @@ def _apply_verse_number_styling(line: Text) -> Text:
 
     # Match leading verse markers: optional spaces, digits (1-3), optional ")" or ".", then space if punctuation absent
     # Examples matched: "1 ", "12 ", "3.", "45)", "7:1 " (be conservative and only take the first number part)
-    m = re.match(r"^\s*(\d{1,3})([).:]?)\s?", line.plain)
+    m = _LEADING_VERSE_NUMBER_RE.match(line.plain)
     if not m:
         return line
 
@@ -156,6 +160,20 @@ def _apply_verse_number_styling(line: Text) -> Text:
         return new_line
     return line
 
+def wrap_highlighted_paragraph(reader, available_width):
+    """Wrap the current paragraph with its current sentence highlighted."""
+    paragraph = reader.chapters[reader.ui_chapter_idx][reader.ui_paragraph_idx]
+    sentences = content_parser.split_into_sentences_cached(paragraph)
+    highlighted_text = Text(justify="left", no_wrap=False)
+
+    for sent_idx, sentence in enumerate(sentences):
+        style = COLORS.TEXT_HIGHLIGHT if sent_idx == reader.ui_sentence_idx else COLORS.TEXT_NORMAL
+        highlighted_text.append(sentence, style=style)
+        if sent_idx < len(sentences) - 1:
+            highlighted_text.append(" ", style=COLORS.TEXT_NORMAL)
+
+    return highlighted_text.wrap(reader.console, available_width)
+
 def get_visible_content(reader):
     """Get the visible content to display."""
     width, height = get_terminal_size()
@@ -167,7 +185,7 @@ def get_visible_content(reader):
         visible_lines = []
         try:
             paragraph = reader.chapters[reader.ui_chapter_idx][reader.ui_paragraph_idx]
-            sentences = content_parser.split_into_sentences(paragraph)
+            sentences = content_parser.split_into_sentences_cached(paragraph)
             if 0 <= reader.ui_sentence_idx < len(sentences):
                 sentence_text = sentences[reader.ui_sentence_idx]
                 # Process verse markers then apply highlight style
@@ -217,18 +235,7 @@ def get_visible_content(reader):
 
     highlighted_paragraph_lines = None
     if current_paragraph_key in reader.paragraph_line_ranges:
-        para_start, para_end = reader.paragraph_line_ranges[current_paragraph_key]
-        paragraph = reader.chapters[reader.ui_chapter_idx][reader.ui_paragraph_idx]
-        sentences = content_parser.split_into_sentences(paragraph)
-        highlighted_text = Text(justify="left", no_wrap=False)
-
-        for sent_idx, sentence in enumerate(sentences):
-            style = COLORS.TEXT_HIGHLIGHT if sent_idx == reader.ui_sentence_idx else COLORS.TEXT_NORMAL
-            highlighted_text.append(sentence, style=style)
-            if sent_idx < len(sentences) - 1:
-                highlighted_text.append(" ", style=COLORS.TEXT_NORMAL)
-
-        highlighted_paragraph_lines = highlighted_text.wrap(reader.console, available_width)
+        highlighted_paragraph_lines = wrap_highlighted_paragraph(reader, available_width)
 
     for i in range(start_line, end_line):
         if i < len(reader.document_lines):
@@ -0,0 +1,101 @@
+"""
+Test that bursts of click_jump commands are debounced into a single jump.
+"""
+
+import asyncio
+
+from lue import audio, config
+from lue.reader import Lue
+
+
+def _make_reader(targets):
+    """A Lue with only the state the click handlers touch; clicks map to `targets` in order."""
+    reader = Lue.__new__(Lue)
+    reader.running = True
+    reader.chapter_idx = reader.paragraph_idx = reader.sentence_idx = 0
+    reader.ui_chapter_idx = reader.ui_paragraph_idx = reader.ui_sentence_idx = 0
+    reader.first_sentence_jump = True
+    reader.auto_scroll_enabled = True
+    reader.pending_click_target = None
+    reader._click_debounce_task = None
+    reader.pending_restart_task = None
+    reader.smooth_scroll_task = None
+    reader.background_task = None
+
+    reader.saves = []
+    reader.restarts = 0
+    clicks = iter(targets)
+
+    def find_sentence_at_click(x, y):
+        return next(clicks)
+
+    def save_extended_progress(**kwargs):
+        reader.saves.append(kwargs)
+
+    async def restart_audio_after_navigation():
+        reader.restarts += 1
+
+    reader._find_sentence_at_click = find_sentence_at_click
+    reader._save_extended_progress = save_extended_progress
+    reader._restart_audio_after_navigation = restart_audio_after_navigation
+    return reader
+
+
+def test_click_burst_jumps_once_to_last_target():
+    targets = [(0, 1, 0), (0, 2, 1), (1, 0, 2), (1, 1, 0)]
+    reader = _make_reader(targets)
+
+    async def run():
+        for i in range(len(targets)):
+            reader._handle_click_jump((10 + i, 5))
+            # Each click lands inside the 150 ms window of the previous one,
+            # though the burst as a whole lasts longer than that
+            await asyncio.sleep(0.1)
+            assert reader.saves == [] and reader.restarts == 0
+        await asyncio.sleep(0.25)
+        await reader.pending_restart_task
+
+    asyncio.run(run())
+    assert reader.saves == [{'sync_audio_position': True}]
+    assert reader.restarts == 1
+    assert (reader.chapter_idx, reader.paragraph_idx, reader.sentence_idx) == targets[-1]
+    assert (reader.ui_chapter_idx, reader.ui_paragraph_idx, reader.ui_sentence_idx) == targets[-1]
+    assert reader.pending_click_target is None
+    assert reader.auto_scroll_enabled is False
+
+
+def test_clicks_outside_text_are_ignored():
+    reader = _make_reader([None, None])
+
+    async def run():
+        reader._handle_click_jump((0, 0))
+        reader._handle_click_jump((0, 1))
+        await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+    assert reader._click_debounce_task is None
+    assert reader.saves == [] and reader.restarts == 0
+
+
+def test_shutdown_cancels_pending_click(monkeypatch):
+    reader = _make_reader([(2, 3, 1)])
+
+    async def stop_and_clear_audio(_reader):
+        pass
+
+    monkeypatch.setattr(audio, "stop_and_clear_audio", stop_and_clear_audio)
+    monkeypatch.setattr(config, "SHOW_ERRORS_ON_EXIT", False)
+
+    async def run():
+        reader._handle_click_jump((10, 5))
+        task = reader._click_debounce_task
+        await reader._shutdown()
+        await asyncio.sleep(0.2)
+        return task
+
+    task = asyncio.run(run())
+    assert task.done()
+    # Only the plain save from _shutdown itself; the click never landed
+    assert reader.saves == [{}]
+    assert reader.restarts == 0
+    assert (reader.chapter_idx, reader.paragraph_idx, reader.sentence_idx) == (0, 0, 0)
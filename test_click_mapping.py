@@ -0,0 +1,116 @@
+"""
+Test that mapping a click to a sentence in ReaderWidget matches a naive re-wrap of the paragraph.
+"""
+
+from lue import content_parser, ui
+from lue.textual_ui.reader_widget import ReaderWidget
+
+
+LONG_PARAGRAPH = " ".join(
+    f"Sentence number {i} is long enough that the paragraph wraps over several lines."
+    for i in range(6)
+)
+
+
+def _make_widget(make_book, width=80):
+    """Lay out a small book at the given terminal width and wrap it in a ReaderWidget."""
+    reader = make_book([["Intro line. Second one."], ["Short.", LONG_PARAGRAPH]], width=width)
+    widget = ReaderWidget(reader)
+    return reader, widget
+
+
+def _naive_sentence(reader, chapter_idx, paragraph_idx, line_idx, char_pos, width):
+    """Re-wrap the paragraph and scan its sentences, as the original click code did."""
+    paragraph = reader.chapters[chapter_idx][paragraph_idx]
+    sentences = content_parser.split_into_sentences(paragraph)
+    wrapped = ui._process_verse_markers(paragraph).wrap(reader.console, max(20, width - 10))
+    para_start, _ = reader.paragraph_line_ranges[(chapter_idx, paragraph_idx)]
+    line_offset = line_idx - para_start
+    if not 0 <= line_offset < len(wrapped):
+        position = 0
+    else:
+        position = sum(len(line.plain) + 1 for line in wrapped[:line_offset])
+        position += max(0, min(char_pos, len(wrapped[line_offset].plain)))
+
+    start = 0
+    for sent_idx, sentence in enumerate(sentences):
+        if start <= position < start + len(sentence):
+            return sent_idx
+        start += len(sentence) + 1
+    return len(sentences) - 1
+
+
+def _paragraph_lines(reader, chapter_idx, paragraph_idx):
+    start, end = reader.paragraph_line_ranges[(chapter_idx, paragraph_idx)]
+    return range(start, end + 1)
+
+
+def test_click_on_first_character_of_each_sentence(make_book):
+    reader, widget = _make_widget(make_book)
+    sentences = content_parser.split_into_sentences(LONG_PARAGRAPH)
+    para_start, _ = reader.paragraph_line_ranges[(1, 1)]
+    wrapped = ui._process_verse_markers(LONG_PARAGRAPH).wrap(reader.console, widget._available_width)
+
+    offset = 0
+    for sent_idx, sentence in enumerate(sentences):
+        # Find the wrapped line and column where this sentence starts
+        line_start = 0
+        for line_offset, line in enumerate(wrapped):
+            if offset < line_start + len(line.plain):
+                break
+            line_start += len(line.plain) + 1
+        column = offset - line_start
+        assert widget._find_sentence_in_paragraph(1, 1, para_start + line_offset, column) == sent_idx
+        offset += len(sentence) + 1
+
+
+def test_click_on_separating_space_falls_back_to_last_sentence(make_book):
+    reader, widget = _make_widget(make_book)
+    line_idx, _ = reader.paragraph_line_ranges[(0, 0)]
+    space = len("Intro line.")
+    assert reader.chapters[0][0][space] == " "
+    assert widget._find_sentence_in_paragraph(0, 0, line_idx, space) == 1
+    assert widget._find_sentence_in_paragraph(0, 0, line_idx, space - 1) == 0
+    assert widget._find_sentence_in_paragraph(0, 0, line_idx, space + 1) == 1
+
+
+def test_click_on_last_wrapped_line(make_book):
+    reader, widget = _make_widget(make_book)
+    _, para_end = reader.paragraph_line_ranges[(1, 1)]
+    last = len(content_parser.split_into_sentences(LONG_PARAGRAPH)) - 1
+    # Within the last line, and past its end (clamped to the line length)
+    assert widget._find_sentence_in_paragraph(1, 1, para_end, 0) == _naive_sentence(reader, 1, 1, para_end, 0, 80)
+    assert widget._find_sentence_in_paragraph(1, 1, para_end, 500) == last
+    # A line past the paragraph maps to its start
+    assert widget._calculate_absolute_char_position(1, 1, para_end + 1, 3, widget._available_width) == 0
+
+
+def test_every_click_matches_naive_wrap(make_book):
+    reader, widget = _make_widget(make_book)
+    for chapter_idx, chapter in enumerate(reader.chapters):
+        for paragraph_idx in range(len(chapter)):
+            for line_idx in _paragraph_lines(reader, chapter_idx, paragraph_idx):
+                for char_pos in range(0, 75, 3):
+                    expected = _naive_sentence(reader, chapter_idx, paragraph_idx, line_idx, char_pos, 80)
+                    got = widget._find_sentence_in_paragraph(chapter_idx, paragraph_idx, line_idx, char_pos)
+                    assert got == expected, (chapter_idx, paragraph_idx, line_idx, char_pos)
+
+
+def test_width_change_invalidates_wrap_cache(make_book, monkeypatch):
+    reader, widget = _make_widget(make_book, width=80)
+    para_start, para_end = reader.paragraph_line_ranges[(1, 1)]
+    widget._find_sentence_in_paragraph(1, 1, para_end, 0)
+    lines_at_80 = len(widget._para_wrap_cache[(1, 1)]) - 1
+    assert lines_at_80 == para_end - para_start + 1
+
+    # Narrow the terminal: relayout, then let the widget pick up the new size
+    monkeypatch.setattr(ui, "get_terminal_size", lambda: (50, 24))
+    ui.update_document_layout(reader)
+    widget._refresh_terminal_size()
+    para_start, para_end = reader.paragraph_line_ranges[(1, 1)]
+
+    for line_idx in range(para_start, para_end + 1):
+        for char_pos in range(0, 40, 4):
+            expected = _naive_sentence(reader, 1, 1, line_idx, char_pos, 50)
+            assert widget._find_sentence_in_paragraph(1, 1, line_idx, char_pos) == expected
+    assert len(widget._para_wrap_cache[(1, 1)]) - 1 == para_end - para_start + 1 > lines_at_80
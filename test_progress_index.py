@@ -0,0 +1,86 @@
+"""
+Test the Textual adapter's progress and position/line indexes against naive counts.
+"""
+
+import pytest
+
+from lue import content_parser, ui
+from lue.textual_adapter import TextualReaderAdapter
+
+
+@pytest.fixture
+def reader(make_book):
+    """A small multi-chapter book with empty paragraphs and an empty chapter."""
+    return make_book([
+        ["Chapter one. It starts here.", "A second paragraph. With two sentences!"],
+        ["Lone sentence.", "", "Before the gap. After the gap? Yes."],
+        [""],
+        ["Last chapter. Final words."],
+    ])
+
+
+def _all_positions(chapters):
+    """Every (chapter, paragraph, sentence) in reading order."""
+    for c, chapter in enumerate(chapters):
+        for p, paragraph in enumerate(chapter):
+            for s in range(len(content_parser.split_into_sentences(paragraph))):
+                yield (c, p, s)
+
+
+def test_reading_progress_matches_naive_count(reader):
+    """Progress is the share of sentences before the current one."""
+    adapter = TextualReaderAdapter(reader)
+    positions = list(_all_positions(reader.chapters))
+    total = len(positions)
+
+    for index, (c, p, s) in enumerate(positions):
+        reader.chapter_idx, reader.paragraph_idx, reader.sentence_idx = c, p, s
+        assert adapter.get_reading_progress() == index / total * 100, (c, p, s)
+
+    # First and last sentences of the book
+    reader.chapter_idx, reader.paragraph_idx, reader.sentence_idx = positions[0]
+    assert adapter.get_reading_progress() == 0
+    reader.chapter_idx, reader.paragraph_idx, reader.sentence_idx = positions[-1]
+    assert adapter.get_reading_progress() == (total - 1) / total * 100
+
+
+def test_sentence_index_bounds(reader):
+    """Book-wide sentence indexes count up in reading order; out-of-range is -1."""
+    adapter = TextualReaderAdapter(reader)
+
+    for index, position in enumerate(_all_positions(reader.chapters)):
+        assert adapter._sentence_index(*position) == index, position
+
+    assert adapter._sentence_index(0, 0, 2) == -1
+    assert adapter._sentence_index(0, 2, 0) == -1
+    assert adapter._sentence_index(4, 0, 0) == -1
+    assert adapter._sentence_index(-1, 0, 0) == -1
+
+
+def test_line_for_position_matches_layout(reader):
+    """The flat line array agrees with position_to_line for every sentence."""
+    adapter = TextualReaderAdapter(reader)
+
+    for position in _all_positions(reader.chapters):
+        expected = reader.position_to_line.get(position, -1)
+        assert adapter._line_for_position(*position) == expected, position
+    assert adapter._line_for_position(9, 0, 0) == -1
+
+    # Loading new chapters relayouts the document and the array follows it
+    reader.chapters = [["Chapter one has been rewritten. " * 6]] + reader.chapters[1:]
+    ui.update_document_layout(reader)
+    for position in _all_positions(reader.chapters):
+        expected = reader.position_to_line.get(position, -1)
+        assert adapter._line_for_position(*position) == expected, position
+
+
+def test_line_to_paragraph_matches_naive_scan(reader):
+    """Each document line belongs to the last paragraph starting at or before it."""
+    adapter = TextualReaderAdapter(reader)
+    starts = sorted((start, key) for key, (start, _) in reader.paragraph_line_ranges.items())
+
+    for line in range(len(reader.document_lines)):
+        owners = [key for start, key in starts if start <= line]
+        expected = (*owners[-1], 0) if owners else None
+        assert adapter._position_at_or_before_line(line) == expected, line
+
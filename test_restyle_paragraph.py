@@ -0,0 +1,125 @@
+"""
+Test that re-styling only the highlighted paragraph matches a full get_visible_content rebuild.
+"""
+
+from lue import content_parser, ui
+from lue.textual_ui.reader_widget import ReaderWidget
+
+
+LONG_PARAGRAPH = " ".join(
+    f"Sentence {i} runs on for a while so that the paragraph wraps onto many lines."
+    for i in range(8)
+)
+
+
+def _make_widget(make_book):
+    """A short terminal, so the long paragraph is cut off at both edges of the window."""
+    reader = make_book(
+        [["First paragraph. Two sentences."], [LONG_PARAGRAPH, "Tail one. Tail two. Tail three."]],
+        width=60, height=10,
+        selection_active=False, selection_start=None, selection_end=None,
+    )
+    return reader, ReaderWidget(reader)
+
+
+def _move_to(reader, chapter_idx, paragraph_idx, sentence_idx, scroll_offset):
+    reader.ui_chapter_idx, reader.ui_paragraph_idx, reader.ui_sentence_idx = (
+        chapter_idx, paragraph_idx, sentence_idx
+    )
+    reader.scroll_offset = scroll_offset
+
+
+def _show_full_frame(widget):
+    """Cache a full rebuild as the last frame, as update_content_display would."""
+    widget._content_cache_key = widget._content_key()
+    widget._visible_lines = ui.get_visible_content(widget.lue)
+
+
+def _assert_same_lines(got, expected):
+    assert len(got) == len(expected)
+    for index, (line, want) in enumerate(zip(got, expected)):
+        assert line.plain == want.plain, index
+        assert line.spans == want.spans, index
+        assert line.style == want.style, index
+
+
+def test_restyle_matches_full_rebuild_at_every_scroll_offset(make_book):
+    reader, widget = _make_widget(make_book)
+    para_start, para_end = reader.paragraph_line_ranges[(1, 0)]
+    sentence_count = len(content_parser.split_into_sentences(LONG_PARAGRAPH))
+    window = len(ui.get_visible_content(reader))
+    assert para_end - para_start + 1 > window
+
+    # From above the paragraph, through windows cutting it at the top or
+    # bottom edge (or both), to where only its last lines are visible
+    for scroll_offset in range(max(0, para_start - window + 1), para_end + 1):
+        _move_to(reader, 1, 0, 0, scroll_offset)
+        _show_full_frame(widget)
+        for sentence_idx in [*range(1, sentence_count), 0]:
+            reader.ui_sentence_idx = sentence_idx
+            restyled = widget._restyle_current_paragraph(widget._content_key())
+            assert restyled is not None
+            _assert_same_lines(restyled, ui.get_visible_content(reader))
+            widget._content_cache_key = widget._content_key()
+            widget._visible_lines = restyled
+
+
+def test_restyle_short_paragraph_after_long_one(make_book):
+    reader, widget = _make_widget(make_book)
+    _, para_end = reader.paragraph_line_ranges[(1, 0)]
+    _move_to(reader, 1, 1, 0, para_end - 2)
+    _show_full_frame(widget)
+    for sentence_idx in (1, 2, 0):
+        reader.ui_sentence_idx = sentence_idx
+        restyled = widget._restyle_current_paragraph(widget._content_key())
+        _assert_same_lines(restyled, ui.get_visible_content(reader))
+        widget._content_cache_key = widget._content_key()
+        widget._visible_lines = restyled
+
+
+def test_restyle_keeps_selection_highlighting(make_book):
+    reader, widget = _make_widget(make_book)
+    para_start, _ = reader.paragraph_line_ranges[(1, 0)]
+    reader.selection_active = True
+    reader.selection_start = (para_start + 3, 12)
+    reader.selection_end = (para_start + 1, 5)
+    _move_to(reader, 1, 0, 0, para_start)
+    _show_full_frame(widget)
+    for sentence_idx in (1, 2, 3, 0):
+        reader.ui_sentence_idx = sentence_idx
+        restyled = widget._restyle_current_paragraph(widget._content_key())
+        _assert_same_lines(restyled, ui.get_visible_content(reader))
+        widget._content_cache_key = widget._content_key()
+        widget._visible_lines = restyled
+
+
+def test_restyle_falls_back_when_more_than_the_sentence_changed(make_book):
+    reader, widget = _make_widget(make_book)
+    para_start, _ = reader.paragraph_line_ranges[(1, 0)]
+
+    # Nothing cached yet
+    _move_to(reader, 1, 0, 0, para_start)
+    assert widget._restyle_current_paragraph(widget._content_key()) is None
+
+    _show_full_frame(widget)
+    reader.ui_sentence_idx = 1
+    assert widget._restyle_current_paragraph(widget._content_key()) is not None
+
+    # Scrolled
+    reader.scroll_offset = para_start + 1
+    assert widget._restyle_current_paragraph(widget._content_key()) is None
+    reader.scroll_offset = para_start
+
+    # Moved to another paragraph
+    _move_to(reader, 1, 1, 0, para_start)
+    assert widget._restyle_current_paragraph(widget._content_key()) is None
+    _move_to(reader, 1, 0, 1, para_start)
+
+    # Focus mode
+    reader.focus_mode = True
+    assert widget._restyle_current_paragraph(widget._content_key()) is None
+    reader.focus_mode = False
+
+    # Relayout
+    ui.update_document_layout(reader)
+    assert widget._restyle_current_paragraph(widget._content_key()) is None
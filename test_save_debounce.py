@@ -0,0 +1,80 @@
+"""
+Test that scrolling and navigating through the Textual adapter coalesces progress writes.
+"""
+
+import asyncio
+
+import pytest
+
+from lue import progress_manager
+from lue.reader import Lue
+from lue.textual_adapter import TextualReaderAdapter, create_textual_adapter
+
+
+@pytest.fixture
+def lue(make_book, monkeypatch):
+    """A Lue with a laid-out book and the adapter installed; writes are recorded."""
+    book = make_book([
+        ["One. Two. Three. Four.", "Five. Six. Seven."],
+        ["Eight. Nine. Ten. Eleven. Twelve."] * 6,
+    ], height=10)
+    reader = Lue.__new__(Lue)
+    reader.__dict__.update(vars(book))
+    reader.target_scroll_offset = 0
+    reader.first_sentence_jump = True
+    reader.is_paused = True
+    reader.tts_model = None
+    reader.smooth_scroll_task = None
+    reader.playback_processes = []
+    reader.progress_file = "unused"
+
+    reader.writes = []
+
+    def save_extended_progress(progress_file, chapter_idx, paragraph_idx, sentence_idx, *args, **kwargs):
+        reader.writes.append((chapter_idx, paragraph_idx, sentence_idx))
+
+    monkeypatch.setattr(progress_manager, "save_extended_progress", save_extended_progress)
+    return create_textual_adapter(reader)
+
+
+def test_held_navigation_keys_write_once_then_trail(lue):
+    async def run():
+        for _ in range(5):
+            lue.move_to_next_sentence()
+        lue.move_to_next_paragraph()
+        lue.move_to_prev_sentence()
+        # The first step writes at once; the rest wait for the trailing save
+        assert lue.writes == [(0, 0, 1)]
+        await asyncio.sleep(TextualReaderAdapter._SAVE_INTERVAL + 0.1)
+
+    asyncio.run(run())
+    assert lue.writes == [(0, 0, 1), (0, 1, 2)]
+    assert (lue.chapter_idx, lue.paragraph_idx, lue.sentence_idx) == (0, 1, 2)
+
+
+def test_line_scrolls_write_once_then_trail(lue):
+    async def run():
+        for _ in range(4):
+            lue.scroll_down()
+        lue.scroll_up()
+        assert len(lue.writes) == 1
+        await asyncio.sleep(TextualReaderAdapter._SAVE_INTERVAL + 0.1)
+
+    asyncio.run(run())
+    assert len(lue.writes) == 2
+    assert lue.scroll_offset == 3
+    assert lue.auto_scroll_enabled is False
+
+
+def test_other_saves_write_at_once_and_replace_the_trailing_save(lue):
+    async def run():
+        lue.move_to_next_sentence()
+        lue.move_to_next_sentence()
+        assert lue.writes == [(0, 0, 1)]
+        # Like _shutdown: not coalesced, and the pending write is dropped
+        lue._save_extended_progress()
+        assert lue.writes == [(0, 0, 1), (0, 0, 2)]
+        await asyncio.sleep(TextualReaderAdapter._SAVE_INTERVAL + 0.1)
+
+    asyncio.run(run())
+    assert lue.writes == [(0, 0, 1), (0, 0, 2)]
@@ -0,0 +1,165 @@
+"""
+Test that large paragraphs are laid out in a worker thread, including stale and failed results.
+"""
+
+import asyncio
+import threading
+
+from rich.text import Text
+from textual.app import App
+
+from lue import ui
+from lue.textual_ui.reader_widget import ReaderWidget
+
+
+HUGE_PARAGRAPH = " ".join(
+    f"Sentence {i} pads the paragraph well past the worker threshold." for i in range(400)
+)
+
+
+class ReaderApp(App):
+    def __init__(self, reader):
+        super().__init__()
+        self.reader = reader
+
+    def compose(self):
+        yield ReaderWidget(self.reader)
+
+
+def _make_reader(make_book):
+    reader = make_book(
+        [["Opening line.", HUGE_PARAGRAPH, "Closing line."]],
+        selection_active=False, selection_start=None, selection_end=None,
+    )
+    reader.chapter_idx = reader.ui_chapter_idx = 0
+    reader.paragraph_idx = reader.ui_paragraph_idx = 1
+    reader.scroll_offset = reader.paragraph_line_ranges[(0, 1)][0]
+    assert len(HUGE_PARAGRAPH) > ReaderWidget.LARGE_PARAGRAPH_CHARS
+    return reader
+
+
+def _expected(reader):
+    return Text("\n").join(ui.get_visible_content(reader))
+
+
+def _gate_visible_content(monkeypatch):
+    """Hold get_visible_content calls until the returned event is set; count the calls."""
+    release = threading.Event()
+    calls = []
+    real = ui.get_visible_content
+
+    def gated(reader):
+        calls.append(reader.ui_sentence_idx)
+        release.wait(5)
+        return real(reader)
+
+    monkeypatch.setattr(ui, "get_visible_content", gated)
+    return release, calls
+
+
+async def _settle(app, pilot):
+    """Let the workers finish and their messages (plus any redraw timer) run."""
+    for _ in range(3):
+        # Superseded thread workers are cancelled but still run to the end
+        await asyncio.gather(*(worker.wait() for worker in app.workers), return_exceptions=True)
+        await pilot.pause(ReaderWidget.FLUSH_INTERVAL * 2)
+
+
+def test_large_paragraph_is_built_in_worker(make_book):
+    reader = _make_reader(make_book)
+
+    async def run():
+        app = ReaderApp(reader)
+        async with app.run_test() as pilot:
+            widget = app.query_one(ReaderWidget)
+            await _settle(app, pilot)
+            assert widget._pending_content_key is None
+            assert widget._content_cache_key == widget._content_key()
+            assert widget._last_content == _expected(reader)
+
+            # Moving the highlight inside the paragraph goes through the worker again
+            reader.sentence_idx = 3
+            widget.update_content_display()
+            assert widget._pending_content_key == widget._content_key()
+            await _settle(app, pilot)
+            assert widget._last_content == _expected(reader)
+
+    asyncio.run(run())
+
+
+def test_result_for_superseded_key_is_dropped(make_book, monkeypatch):
+    reader = _make_reader(make_book)
+    release, calls = _gate_visible_content(monkeypatch)
+
+    async def run():
+        app = ReaderApp(reader)
+        async with app.run_test() as pilot:
+            widget = app.query_one(ReaderWidget)
+            await pilot.pause(ReaderWidget.FLUSH_INTERVAL * 2)
+            first_key = widget._pending_content_key
+            # A newer position replaces the pending key before the first worker returns
+            reader.sentence_idx = 2
+            widget.update_content_display()
+            assert widget._pending_content_key not in (None, first_key)
+            release.set()
+            await _settle(app, pilot)
+            assert widget._content_cache_key == widget._content_key()
+            assert widget._content_key()[2] == 2
+            # The old result was dropped rather than triggering another rebuild
+            assert calls == [0, 2]
+            assert widget._last_content == _expected(reader)
+
+    asyncio.run(run())
+
+
+def test_result_for_moved_position_is_rebuilt(make_book, monkeypatch):
+    reader = _make_reader(make_book)
+    release, calls = _gate_visible_content(monkeypatch)
+
+    async def run():
+        app = ReaderApp(reader)
+        async with app.run_test() as pilot:
+            widget = app.query_one(ReaderWidget)
+            # Let the mount-time redraw run; it finds the key already pending
+            await pilot.pause(ReaderWidget.FLUSH_INTERVAL * 2)
+            first_key = widget._pending_content_key
+            # The position moves without a redraw while the worker is still running
+            reader.sentence_idx = reader.ui_sentence_idx = 5
+            assert widget._pending_content_key == first_key != widget._content_key()
+            release.set()
+            await _settle(app, pilot)
+            assert widget._pending_content_key is None
+            assert widget._content_cache_key == widget._content_key()
+            assert widget._content_key()[2] == 5
+            assert calls == [0, 5]
+            assert widget._last_content == _expected(reader)
+
+    asyncio.run(run())
+
+
+def test_worker_failure_shows_error_and_retries(make_book, monkeypatch):
+    reader = _make_reader(make_book)
+    real = ui.get_visible_content
+
+    def broken(reader):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(ui, "get_visible_content", broken)
+
+    async def run():
+        app = ReaderApp(reader)
+        async with app.run_test() as pilot:
+            widget = app.query_one(ReaderWidget)
+            await _settle(app, pilot)
+            assert widget._pending_content_key is None
+            assert widget._content_cache_key is None
+            assert widget._content_widget.content.plain == "Error updating display: boom"
+
+            # The same key is not stuck behind the failed worker
+            monkeypatch.setattr(ui, "get_visible_content", real)
+            widget.update_content_display()
+            assert widget._pending_content_key == widget._content_key()
+            await _settle(app, pilot)
+            assert widget._last_content == _expected(reader)
+
+    asyncio.run(run())